@@ -13,36 +13,47 @@ class LibraryController:
         self._current_book = None
 
     def get_all_books(self, category_id=None, series_id=None, status=None):
+        book_data_list = self.get_all_book_data(category_id, series_id, status)
+        return [Book(book_data, self.db_manager) for book_data in book_data_list]
+
+    def get_all_book_data(self, category_id=None, series_id=None, status=None):
+        # Book を生成せず行データのまま返す (表示側で必要な分だけ Book にする)
         query_params = {}
         if status:
             query_params["status"] = status
 
         if series_id:
-            book_data_list = self.db_manager.get_books_in_series(series_id)
-
-            if status:
-                book_data_list = [
-                    book for book in book_data_list if book.get("status") == status
-                ]
+            return self.db_manager.get_books_in_series(series_id, **query_params)
         elif category_id:
-            book_data_list = self.db_manager.get_books_by_category(
-                category_id, **query_params
-            )
+            return self.db_manager.get_books_by_category(category_id, **query_params)
         else:
-            book_data_list = self.db_manager.search_books(**query_params)
-
-        return [Book(book_data, self.db_manager) for book_data in book_data_list]
+            return self.db_manager.search_books(**query_params)
 
     def search_books(self, query):
-        book_data_list = self.db_manager.search_books(query=query)
+        book_data_list = self.search_book_data(query)
         return [Book(book_data, self.db_manager) for book_data in book_data_list]
 
+    def search_book_data(self, query):
+        return self.db_manager.search_books(query=query)
+
     def get_book(self, book_id):
         book_data = self.db_manager.get_book(book_id)
         if book_data:
             return Book(book_data, self.db_manager)
         return None
 
+    def get_books(self, book_ids):
+        # 1回のクエリでまとめて取得し、指定されたIDの順に並べて返す
+        book_data_by_id = {
+            book_data["id"]: book_data
+            for book_data in self.db_manager.get_books(book_ids)
+        }
+        return [
+            Book(book_data_by_id[book_id], self.db_manager)
+            for book_id in book_ids
+            if book_id in book_data_by_id
+        ]
+
     def get_current_book(self):
         return self._current_book
 
@@ -132,9 +143,24 @@ class LibraryController:
         return imported_ids
 
     def get_all_series(self, category_id=None):
+        series_data_list, books_by_series = self.get_all_series_data(category_id)
+        return self.build_series(series_data_list, books_by_series)
+
+    def get_all_series_data(self, category_id=None):
+        # シリーズごとに書籍を問い合わせないよう、まとめて取得して割り当てる
         series_data_list = self.db_manager.get_all_series(category_id)
+        books_by_series = self.db_manager.get_books_by_series(category_id)
+        return series_data_list, books_by_series
+
+    def build_series(self, series_data_list, books_by_series):
+        # 行データ (別スレッドで取得したものを含む) からこの接続の Series を組み立てる
         return [
-            Series(series_data, self.db_manager) for series_data in series_data_list
+            Series(
+                series_data,
+                self.db_manager,
+                books_by_series.get(series_data["id"], []),
+            )
+            for series_data in series_data_list
         ]
 
     def get_series(self, series_id):
@@ -185,33 +211,30 @@ class LibraryController:
     def update_book_metadata(self, book_id, **metadata):
         book = self.get_book(book_id)
         if book:
-            # 更新を実行
-            success = book.update_metadata(**metadata)
-
-            # デバッグ: 更新後のデータベースの状態を直接確認
-            if success:
-                # データベースから直接クエリで確認
-                conn = self.db_manager.connect()
-                cursor = conn.cursor()
-                cursor.execute("SELECT category_id FROM books WHERE id = ?", (book_id,))
-                result = cursor.fetchone()
-                if result:
-                    print(
-                        f"Database after update - Book {book_id}: category_id={result['category_id']}"
-                    )
-
-                # 更新後の書籍オブジェクトを取得して確認
-                updated_book = self.get_book(book_id)
-                print(
-                    f"Updated book object - Book {book_id}: category_id={updated_book.category_id}"
-                )
-
-            return success
+            return book.update_metadata(**metadata)
         return False
 
     def batch_update_metadata(self, book_ids, **metadata):
         return self.db_manager.batch_update_metadata(book_ids, metadata)
 
+    def batch_update_status(self, book_ids, status):
+        return self.db_manager.batch_update_reading_status(book_ids, status)
+
+    def batch_add_to_series(self, book_ids, series_id, start_order=None):
+        # start_order を指定した場合は、book_ids の順に連番を振る
+        if start_order is None:
+            return self.db_manager.batch_update_metadata(
+                list(book_ids), {"series_id": series_id}
+            )
+        return self.db_manager.batch_update_series_order(
+            series_id, list(book_ids), start_order
+        )
+
+    def batch_remove_from_series(self, book_ids):
+        return self.db_manager.batch_update_metadata(
+            list(book_ids), {"series_id": None, "series_order": None}
+        )
+
     def remove_book(self, book_id, delete_file=False):
         book = self.get_book(book_id)
         if not book:
@@ -1,22 +1,41 @@
 import hashlib
 import io
+import logging
 import os
+import threading
 import time
 from pathlib import Path
 
 import fitz  # PyMuPDF
 from PIL import Image, ImageChops
 
+logger = logging.getLogger(__name__)
+
 
 class Book:
     STATUS_UNREAD = "unread"
     STATUS_READING = "reading"
     STATUS_COMPLETED = "completed"
 
+    STATUS_NAMES = {
+        STATUS_UNREAD: "Unread",
+        STATUS_READING: "Reading",
+        STATUS_COMPLETED: "Completed",
+    }
+
+    # IDが変わったら取り直す必要がある、一覧取得時にJOINした列
+    JOINED_FIELDS = {
+        "series_id": ("series_name", "series_category_id", "series_category_name"),
+        "category_id": ("category_name",),
+    }
+
     _cover_cache = {}
     _cache_size_limit = 300
     _cache_time_limit = 600
 
+    # ワーカースレッドでの表紙描画は、同時に1冊ずつに限る
+    _render_lock = threading.Lock()
+
     def __init__(self, book_data, db_manager):
         self.data = book_data
         self.db_manager = db_manager
@@ -56,6 +75,10 @@ class Book:
     def status(self):
         return self.data.get("status", self.STATUS_UNREAD)
 
+    @property
+    def status_name(self):
+        return self.STATUS_NAMES.get(self.status, self.STATUS_NAMES[self.STATUS_UNREAD])
+
     @property
     def current_page(self):
         return self.data.get("current_page", 0)
@@ -83,10 +106,32 @@ class Book:
     @property
     def category_name(self):
         if self.category_id:
+            # 一覧取得時にJOIN済みであれば再問い合わせしない
+            if "category_name" in self.data:
+                return self.data["category_name"]
             category = self.db_manager.get_category(self.category_id)
             return category["name"] if category else None
         return None
 
+    @property
+    def series_name(self):
+        self._load_series_info()
+        return self.data.get("series_name")
+
+    @property
+    def series_category_name(self):
+        self._load_series_info()
+        return self.data.get("series_category_name")
+
+    def _load_series_info(self):
+        if "series_category_name" in self.data:
+            return
+
+        series = self.db_manager.get_series(self.series_id) if self.series_id else None
+        self.data["series_name"] = series["name"] if series else None
+        self.data["series_category_id"] = series["category_id"] if series else None
+        self.data["series_category_name"] = series["category_name"] if series else None
+
     def exists(self):
         return os.path.isfile(self.file_path)
 
@@ -153,6 +198,12 @@ class Book:
         for key in expired_keys:
             del cls._cover_cache[key]
 
+    @classmethod
+    def invalidate_cover(cls, book_id):
+        # 表紙が差し替えられた書籍の画像を共有キャッシュから取り除く
+        for key in [key for key in cls._cover_cache if key[0] == book_id]:
+            del cls._cover_cache[key]
+
     def get_page(self, page_number):
         doc = self.open()
         if not doc or page_number < 0 or page_number >= len(doc):
@@ -197,113 +248,153 @@ class Book:
             size_key = "_full"
 
         hash_key = hashlib.md5(f"{base_key}{size_key}".encode()).hexdigest()
-        return hash_key
+        # 書籍単位で破棄できるよう、キーの先頭に書籍IDを持たせる
+        return (self.id, hash_key)
 
     def get_cover_image(self, force_reload=False, thumbnail_size=None, auto_trim=True):
+        if not force_reload:
+            img_data = self.get_cached_cover_image(thumbnail_size, auto_trim)
+            if img_data is not None:
+                return img_data
+
+        if not self.exists():
+            return None
+
+        try:
+            pix = self.render_cover_pixmap(thumbnail_size)
+            if pix is not None:
+                try:
+                    img_data = self.encode_cover_image(
+                        (pix.width, pix.height, pix.samples), thumbnail_size, auto_trim
+                    )
+                except Exception as e:
+                    logger.debug("Error processing cover image with PIL: %s", e)
+                    img_data = pix.tobytes()
+                    self.store_cover_image(
+                        img_data, thumbnail_size, auto_trim, persist=False
+                    )
+                    return img_data
+
+                self.store_cover_image(img_data, thumbnail_size, auto_trim)
+                return img_data
+        except Exception as e:
+            logger.debug("Error generating cover image: %s", e)
+
+        return None
+
+    def get_cached_cover_image(self, thumbnail_size=None, auto_trim=True):
         cache_key = self._get_cache_key(thumbnail_size, auto_trim)
 
-        if not force_reload and cache_key in self._cover_cache:
+        if cache_key in self._cover_cache:
             timestamp, data = self._cover_cache[cache_key]
             if time.time() - timestamp <= self._cache_time_limit:
                 return data
 
-        if not force_reload and cache_key in self._local_cover_cache:
+        if cache_key in self._local_cover_cache:
             return self._local_cover_cache[cache_key]
 
-        if (
-            not force_reload
-            and not thumbnail_size
-            and not auto_trim
-            and self.data.get("cover_image")
-        ):
-            self._local_cover_cache[cache_key] = self.data["cover_image"]
-            self._cover_cache[cache_key] = (time.time(), self.data["cover_image"])
-            if len(self._cover_cache) > self._cache_size_limit:
-                self._cleanup_cache()
+        if not thumbnail_size and not auto_trim and self.data.get("cover_image"):
+            self.store_cover_image(
+                self.data["cover_image"], thumbnail_size, auto_trim, persist=False
+            )
             return self.data["cover_image"]
 
-        if not self.exists():
+        return None
+
+    def render_cover_pixmap(self, thumbnail_size=None):
+        # 共有のドキュメントを使うので、GUIスレッドからのみ呼び出すこと
+        doc = self.open()
+        if not doc or len(doc) == 0:
             return None
 
-        try:
-            doc = self.open()
-            if doc and len(doc) > 0:
-                page = doc[0]
-
-                if thumbnail_size:
-                    rect = page.rect
-                    page_width, page_height = rect.width, rect.height
-                    target_width, target_height = thumbnail_size
-                    scale_width = target_width / page_width
-                    scale_height = target_height / page_height
-                    scale = min(scale_width, scale_height) * 1.2
-
-                    try:
-                        pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale))
-                    except Exception as e:
-                        print(f"Error getting pixmap for thumbnail: {e}")
-                        pix = page.get_pixmap(matrix=fitz.Matrix(0.5, 0.5))
-                else:
-                    pix = page.get_pixmap(matrix=fitz.Matrix(0.5, 0.5))
+        return self._render_first_page(doc, thumbnail_size)
 
-                try:
-                    img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+    def render_cover_source(self, thumbnail_size=None):
+        # ワーカースレッド用。共有のドキュメントには触れず、描画のたびに専用に開く
+        with self._render_lock:
+            with fitz.open(self.file_path) as doc:
+                if len(doc) == 0:
+                    return None
 
-                    if auto_trim:
-                        img = self._trim_horizontal_white_borders(img)
+                pix = self._render_first_page(doc, thumbnail_size)
+                return (pix.width, pix.height, pix.samples)
 
-                    if thumbnail_size:
-                        target_width, target_height = thumbnail_size
+    @staticmethod
+    def _render_first_page(doc, thumbnail_size=None):
+        page = doc[0]
 
-                        img_width, img_height = img.size
-                        scale_width = target_width / img_width
-                        scale_height = target_height / img_height
-                        scale = min(scale_width, scale_height)
+        if thumbnail_size:
+            rect = page.rect
+            page_width, page_height = rect.width, rect.height
+            target_width, target_height = thumbnail_size
+            scale_width = target_width / page_width
+            scale_height = target_height / page_height
+            scale = min(scale_width, scale_height) * 1.2
 
-                        new_width = int(img_width * scale)
-                        new_height = int(img_height * scale)
+            try:
+                return page.get_pixmap(matrix=fitz.Matrix(scale, scale))
+            except Exception as e:
+                logger.debug("Error getting pixmap for thumbnail: %s", e)
 
-                        img = img.resize((new_width, new_height), Image.LANCZOS)
+        return page.get_pixmap(matrix=fitz.Matrix(0.5, 0.5))
 
-                        if new_width < target_width or new_height < target_height:
-                            new_img = Image.new(
-                                "RGB", (target_width, target_height), (255, 255, 255)
-                            )
-                            paste_x = (target_width - new_width) // 2
-                            paste_y = (target_height - new_height) // 2
-                            new_img.paste(img, (paste_x, paste_y))
-                            img = new_img
+    def encode_cover_image(self, source, thumbnail_size=None, auto_trim=True):
+        # PILのみを使うため、ワーカースレッドから呼び出してもよい
+        img = self.prepare_cover_image(source, thumbnail_size, auto_trim)
+        return self.encode_image(img)
 
-                    buffer = io.BytesIO()
-                    img.save(buffer, format="JPEG", quality=85, optimize=True)
-                    img_data = buffer.getvalue()
+    @staticmethod
+    def encode_image(img):
+        buffer = io.BytesIO()
+        img.save(buffer, format="JPEG", quality=85, optimize=True)
+        return buffer.getvalue()
 
-                    self._local_cover_cache[cache_key] = img_data
-                    self._cover_cache[cache_key] = (time.time(), img_data)
+    def prepare_cover_image(self, source, thumbnail_size=None, auto_trim=True):
+        # PILのみを使うため、ワーカースレッドから呼び出してもよい
+        width, height, samples = source
+        img = Image.frombytes("RGB", [width, height], samples)
 
-                    if len(self._cover_cache) > self._cache_size_limit:
-                        self._cleanup_cache()
+        if auto_trim:
+            img = self._trim_horizontal_white_borders(img)
 
-                    if not thumbnail_size and not auto_trim:
-                        self.db_manager.update_book(self.id, cover_image=img_data)
-                        self.data["cover_image"] = img_data
+        if thumbnail_size:
+            target_width, target_height = thumbnail_size
 
-                    return img_data
-                except ImportError:
-                    img_data = pix.tobytes()
-                    self._local_cover_cache[cache_key] = img_data
-                    self._cover_cache[cache_key] = (time.time(), img_data)
-                    return img_data
-                except Exception as e:
-                    print(f"Error processing cover image with PIL: {e}")
-                    img_data = pix.tobytes()
-                    self._local_cover_cache[cache_key] = img_data
-                    self._cover_cache[cache_key] = (time.time(), img_data)
-                    return img_data
-        except Exception as e:
-            print(f"Error generating cover image: {e}")
+            img_width, img_height = img.size
+            scale_width = target_width / img_width
+            scale_height = target_height / img_height
+            scale = min(scale_width, scale_height)
 
-        return None
+            new_width = int(img_width * scale)
+            new_height = int(img_height * scale)
+
+            img = img.resize((new_width, new_height), Image.LANCZOS)
+
+            if new_width < target_width or new_height < target_height:
+                new_img = Image.new(
+                    "RGB", (target_width, target_height), (255, 255, 255)
+                )
+                paste_x = (target_width - new_width) // 2
+                paste_y = (target_height - new_height) // 2
+                new_img.paste(img, (paste_x, paste_y))
+                img = new_img
+
+        return img
+
+    def store_cover_image(
+        self, img_data, thumbnail_size=None, auto_trim=True, persist=True
+    ):
+        cache_key = self._get_cache_key(thumbnail_size, auto_trim)
+
+        self._local_cover_cache[cache_key] = img_data
+        self._cover_cache[cache_key] = (time.time(), img_data)
+
+        if len(self._cover_cache) > self._cache_size_limit:
+            self._cleanup_cache()
+
+        if persist and not thumbnail_size and not auto_trim:
+            self.db_manager.update_book(self.id, cover_image=img_data)
+            self.data["cover_image"] = img_data
 
     def _trim_horizontal_white_borders(self, image, threshold=245, min_margin=5):
         try:
@@ -332,10 +423,20 @@ class Book:
             if left_bound > width * 0.05 or right_bound < width * 0.95:
                 return image.crop((left_bound, 0, right_bound + 1, height))
         except Exception as e:
-            print(f"Error trimming horizontal borders: {e}")
+            logger.debug("Error trimming horizontal borders: %s", e)
 
         return image
 
+    def update_data(self, **fields):
+        # 参照先のIDが変わった列は、古い名前が残らないよう次の参照時に取り直させる
+        for key, joined_fields in self.JOINED_FIELDS.items():
+            if key in fields and fields[key] != self.data.get(key):
+                for joined_field in joined_fields:
+                    if joined_field not in fields:
+                        self.data.pop(joined_field, None)
+
+        self.data.update(fields)
+
     def update_metadata(self, **kwargs):
         standard_fields = {
             "title",
@@ -353,8 +454,7 @@ class Book:
         if standard_updates:
             db_success = self.db_manager.update_book(self.id, **standard_updates)
             if db_success:
-                for k, v in standard_updates.items():
-                    self.data[k] = v
+                self.update_data(**standard_updates)
             success = success and db_success
 
         for key, value in custom_updates.items():
@@ -4,10 +4,11 @@ from pathlib import Path
 
 
 class DatabaseManager:
-    def __init__(self, db_path="library.db"):
+    def __init__(self, db_path="library.db", create_tables=True):
         self.db_path = db_path
         self.conn = None
-        self._create_tables_if_not_exist()
+        if create_tables:
+            self._create_tables_if_not_exist()
 
     def connect(self):
         if self.conn is None:
@@ -146,9 +147,14 @@ class DatabaseManager:
 
         cursor.execute(
             """
-        SELECT b.*, rp.current_page, rp.total_pages, rp.status, rp.last_read_date
+        SELECT b.*, rp.current_page, rp.total_pages, rp.status, rp.last_read_date,
+               s.name as series_name, s.category_id as series_category_id,
+               c.name as series_category_name, bc.name as category_name
         FROM books b
         LEFT JOIN reading_progress rp ON b.id = rp.book_id
+        LEFT JOIN series s ON b.series_id = s.id
+        LEFT JOIN categories c ON s.category_id = c.id
+        LEFT JOIN categories bc ON b.category_id = bc.id
         WHERE b.id = ?
         """,
             (book_id,),
@@ -159,6 +165,32 @@ class DatabaseManager:
             return dict(row)
         return None
 
+    def get_books(self, book_ids):
+        if not book_ids:
+            return []
+
+        conn = self.connect()
+        cursor = conn.cursor()
+
+        placeholders = ", ".join(["?"] * len(book_ids))
+
+        cursor.execute(
+            f"""
+        SELECT b.*, rp.current_page, rp.total_pages, rp.status, rp.last_read_date,
+               s.name as series_name, s.category_id as series_category_id,
+               c.name as series_category_name, bc.name as category_name
+        FROM books b
+        LEFT JOIN reading_progress rp ON b.id = rp.book_id
+        LEFT JOIN series s ON b.series_id = s.id
+        LEFT JOIN categories c ON s.category_id = c.id
+        LEFT JOIN categories bc ON b.category_id = bc.id
+        WHERE b.id IN ({placeholders})
+        """,
+            list(book_ids),
+        )
+
+        return [dict(row) for row in cursor.fetchall()]
+
     def update_book(self, book_id, **kwargs):
         allowed_fields = {
             "title",
@@ -236,6 +268,53 @@ class DatabaseManager:
         conn.commit()
         return cursor.rowcount > 0
 
+    def batch_update_reading_status(self, book_ids, status):
+        if not book_ids:
+            return 0
+
+        conn = self.connect()
+        cursor = conn.cursor()
+
+        set_clause = "status = ?"
+        if status == "reading":
+            set_clause += ", last_read_date = CURRENT_TIMESTAMP"
+
+        placeholders = ", ".join(["?"] * len(book_ids))
+
+        cursor.execute(
+            f"""
+        UPDATE reading_progress
+        SET {set_clause}
+        WHERE book_id IN ({placeholders})
+        """,
+            [status] + list(book_ids),
+        )
+
+        conn.commit()
+        return cursor.rowcount
+
+    def batch_update_series_order(self, series_id, book_ids, start_order):
+        if not book_ids:
+            return 0
+
+        conn = self.connect()
+        cursor = conn.cursor()
+
+        cursor.executemany(
+            """
+        UPDATE books
+        SET series_id = ?, series_order = ?
+        WHERE id = ?
+        """,
+            [
+                (series_id, order, book_id)
+                for order, book_id in enumerate(book_ids, start_order)
+            ],
+        )
+
+        conn.commit()
+        return cursor.rowcount
+
     def add_series(self, name, description=None, category_id=None):
         conn = self.connect()
         cursor = conn.cursor()
@@ -270,19 +349,44 @@ class DatabaseManager:
             return dict(row)
         return None
 
-    def get_books_in_series(self, series_id):
+    def get_books_in_series(self, series_id, status=None):
+        if status:
+            return self._get_series_books(
+                "b.series_id = ? AND rp.status = ?", (series_id, status)
+            )
+        return self._get_series_books("b.series_id = ?", (series_id,))
+
+    def get_books_by_series(self, category_id=None):
+        # 全シリーズの書籍を1回のクエリで取得し、シリーズIDごとにまとめる
+        where = "b.series_id IS NOT NULL"
+        params = ()
+        if category_id:
+            where += " AND s.category_id = ?"
+            params = (category_id,)
+
+        books_by_series = {}
+        for book in self._get_series_books(where, params):
+            books_by_series.setdefault(book["series_id"], []).append(book)
+        return books_by_series
+
+    def _get_series_books(self, where, params):
         conn = self.connect()
         cursor = conn.cursor()
 
         cursor.execute(
-            """
-            SELECT b.*, rp.status, rp.current_page, rp.total_pages
+            f"""
+            SELECT b.*, rp.status, rp.current_page, rp.total_pages,
+                   s.name as series_name, s.category_id as series_category_id,
+                   c.name as series_category_name, bc.name as category_name
             FROM books b
             LEFT JOIN reading_progress rp ON b.id = rp.book_id
-            WHERE b.series_id = ?
+            LEFT JOIN series s ON b.series_id = s.id
+            LEFT JOIN categories c ON s.category_id = c.id
+            LEFT JOIN categories bc ON b.category_id = bc.id
+            WHERE {where}
             ORDER BY b.series_order, b.title COLLATE NOCASE
             """,
-            (series_id,),
+            params,
         )
 
         results = [dict(row) for row in cursor.fetchall()]
@@ -312,11 +416,14 @@ class DatabaseManager:
         cursor = conn.cursor()
 
         sql = """
-        SELECT b.*, rp.status, rp.current_page, s.name as series_name
+        SELECT b.*, rp.status, rp.current_page, rp.total_pages,
+               s.name as series_name, s.category_id as series_category_id,
+               c.name as series_category_name, bc.name as category_name
         FROM books b
         LEFT JOIN reading_progress rp ON b.id = rp.book_id
         LEFT JOIN series s ON b.series_id = s.id
         LEFT JOIN categories c ON s.category_id = c.id
+        LEFT JOIN categories bc ON b.category_id = bc.id
         WHERE 1=1
         """
 
@@ -536,11 +643,14 @@ class DatabaseManager:
 
         # 基本クエリ
         sql = """
-        SELECT b.*, rp.status, rp.current_page, s.name as series_name, c.name as category_name
+        SELECT b.*, rp.status, rp.current_page, rp.total_pages,
+               s.name as series_name, s.category_id as series_category_id,
+               sc.name as series_category_name, bc.name as category_name
         FROM books b
         LEFT JOIN reading_progress rp ON b.id = rp.book_id
         LEFT JOIN series s ON b.series_id = s.id
-        LEFT JOIN categories c ON (b.category_id = c.id OR s.category_id = c.id)
+        LEFT JOIN categories sc ON s.category_id = sc.id
+        LEFT JOIN categories bc ON b.category_id = bc.id
         WHERE (b.category_id = ? OR s.category_id = ?)
         """
 
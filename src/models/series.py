@@ -2,10 +2,14 @@ from models.book import Book
 
 
 class Series:
-    def __init__(self, series_data, db_manager):
+    def __init__(self, series_data, db_manager, book_data_list=None):
         self.data = series_data
         self.db_manager = db_manager
         self._books = None
+        if book_data_list is not None:
+            self._books = [
+                Book(book_data, self.db_manager) for book_data in book_data_list
+            ]
         self._custom_metadata = None
 
     @property
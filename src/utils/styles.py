@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from utils.theme import AppTheme
 
 
@@ -64,6 +66,7 @@ class StyleSheets:
     """
 
     @staticmethod
+    @lru_cache(maxsize=8)
     def reading_status_style(status):
         color = AppTheme.get_reading_status_color(status)
         return f"color: {color}; font-weight: bold;"
@@ -1,14 +1,44 @@
-from typing import Any
+from typing import Any, Dict, Optional, Tuple
 
-from PyQt6.QtCore import QByteArray
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QImage, QPainter, QPixmap
 from PyQt6.QtWidgets import QMessageBox
 
+from utils.theme import AppTheme
 
-def create_pixmap_from_bytes(data: bytes) -> QPixmap:
-    pixmap = QPixmap()
-    if data:
-        pixmap.loadFromData(QByteArray(data))
+_placeholder_pixmaps: Dict[Tuple[str, int, int], QPixmap] = {}
+
+
+def create_pixmap_from_bytes(
+    data: bytes, size: Optional[Tuple[int, int]] = None
+) -> QPixmap:
+    if not data:
+        return QPixmap()
+
+    image = QImage.fromData(data)
+    # 表示サイズが決まっている場合は一度だけ縮小し、描画のたびに拡縮させない
+    if size and not image.isNull() and (image.width(), image.height()) != size:
+        image = image.scaled(
+            *size,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+    return QPixmap.fromImage(image)
+
+
+def get_placeholder_pixmap(text: str, width: int, height: int) -> QPixmap:
+    key = (text, width, height)
+    pixmap = _placeholder_pixmaps.get(key)
+    if pixmap is None:
+        pixmap = QPixmap(width, height)
+        pixmap.fill(QColor(AppTheme.PLACEHOLDER_BACKGROUND))
+
+        painter = QPainter(pixmap)
+        painter.setPen(QColor(AppTheme.TEXT_SECONDARY))
+        painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, text)
+        painter.end()
+
+        _placeholder_pixmaps[key] = pixmap
     return pixmap
 
 
@@ -1,5 +0,0 @@
-# Base view classes
-from .base_grid_view import BaseGridView
-from .base_item_widget import BaseItemWidget
-from .base_list_view import BaseListView
-from .base_view import BaseView
@@ -28,9 +28,7 @@ class BatchMetadataEditor(QDialog):
 
         self.library_controller = library_controller
         self.book_ids = book_ids
-        self.books = [library_controller.get_book(book_id) for book_id in book_ids]
-
-        self.books = [book for book in self.books if book is not None]
+        self.books = library_controller.get_books(book_ids)
         if not self.books:
             raise ValueError("No valid books found for the provided IDs.")
 
@@ -101,13 +99,10 @@ class BatchMetadataEditor(QDialog):
             publisher_item = QTableWidgetItem(book.publisher or "")
             self.books_table.setItem(i, 2, publisher_item)
 
-            series_text = ""
-            if book.series_id:
-                series = self.library_controller.get_series(book.series_id)
-                if series:
-                    series_text = series.name
-                    if book.series_order:
-                        series_text += f" #{book.series_order}"
+            # シリーズ名は書籍取得時に JOIN 済みなので、行ごとにシリーズを問い合わせない
+            series_text = book.series_name or ""
+            if series_text and book.series_order:
+                series_text += f" #{book.series_order}"
             series_item = QTableWidgetItem(series_text)
             self.books_table.setItem(i, 3, series_item)
 
@@ -382,13 +377,11 @@ class BatchMetadataEditor(QDialog):
                     else:
                         sorted_books = sorted(self.books, key=lambda b: b.title)
 
-                    current_order = start_order
-                    for book in sorted_books:
-                        if book.id in self.book_ids:
-                            self.library_controller.update_book_metadata(
-                                book.id, series_id=series_id, series_order=current_order
-                            )
-                            current_order += 1
+                    self.library_controller.batch_add_to_series(
+                        [book.id for book in sorted_books if book.id in self.book_ids],
+                        series_id,
+                        start_order,
+                    )
 
         for key, edit in self.custom_editors.items():
             value = edit.text().strip()
@@ -401,5 +394,4 @@ class BatchMetadataEditor(QDialog):
             )
 
         if status is not None:
-            for book_id in self.book_ids:
-                self.library_controller.update_book_progress(book_id, status=status)
+            self.library_controller.batch_update_status(self.book_ids, status)
@@ -198,6 +198,7 @@ class ImportDialog(QDialog):
 
         self.cancel_button = QPushButton("Cancel")
         self.cancel_button.clicked.connect(self.reject)
+        self._cancel_slot = self.reject
         self.button_box.addButton(
             self.cancel_button, QDialogButtonBox.ButtonRole.RejectRole
         )
@@ -227,17 +228,14 @@ class ImportDialog(QDialog):
         self.import_button.setEnabled(has_files and not importing)
         self.import_button.setVisible(not importing)
 
-        if importing:
-            self.cancel_button.setText("Abort")
-            self.cancel_button.clicked.disconnect()
-            self.cancel_button.clicked.connect(self.abort_import)
-        else:
-            self.cancel_button.setText("Cancel")
-            try:
-                self.cancel_button.clicked.disconnect()
-            except:
-                pass
-            self.cancel_button.clicked.connect(self.reject)
+        self.cancel_button.setText("Abort" if importing else "Cancel")
+
+        # 接続中のスロットを覚えておき、切り替えが必要なときだけ付け替える
+        cancel_slot = self.abort_import if importing else self.reject
+        if cancel_slot != self._cancel_slot:
+            self.cancel_button.clicked.disconnect(self._cancel_slot)
+            self.cancel_button.clicked.connect(cancel_slot)
+            self._cancel_slot = cancel_slot
 
         self.close_button.setVisible(not has_files and not importing)
 
@@ -1,347 +1,893 @@
+import logging
+import sqlite3
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import islice
+
 from PyQt6.QtCore import (
-    QByteArray,
-    QEvent,
-    QPoint,
+    QAbstractListModel,
+    QItemSelectionModel,
+    QModelIndex,
+    QObject,
+    QRect,
+    QRectF,
+    QRunnable,
     QSettings,
     QSize,
     Qt,
+    QThread,
+    QThreadPool,
     QTimer,
     pyqtSignal,
 )
-from PyQt6.QtGui import QAction, QColor, QIcon, QImage, QPalette, QPixmap
+from PyQt6.QtGui import (
+    QAction,
+    QColor,
+    QFont,
+    QFontMetrics,
+    QImage,
+    QPainter,
+    QPalette,
+    QPixmap,
+    QPixmapCache,
+)
 from PyQt6.QtWidgets import (
     QAbstractItemView,
     QApplication,
-    QFrame,
-    QGridLayout,
-    QHBoxLayout,
-    QLabel,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QMenu,
-    QPushButton,
-    QScrollArea,
-    QSizePolicy,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
     QVBoxLayout,
     QWidget,
 )
 
 from models.book import Book
+from utils.theme import AppTheme
+from utils.ui_utils import get_placeholder_pixmap
+
+logger = logging.getLogger(__name__)
+
+# シリーズから外した書籍に反映するフィールド (一覧取得時にJOINした列を含む)
+SERIES_CLEARED_FIELDS = {
+    "series_id": None,
+    "series_order": None,
+    "series_name": None,
+    "series_category_id": None,
+    "series_category_name": None,
+}
+
+# 「Mark as」メニューに並べる読書状態と表示名
+MARK_AS_STATUSES = tuple(Book.STATUS_NAMES.items())
+
+# スクロール時に一度に追加する行数の範囲
+MIN_BATCH_SIZE = 10
+MAX_BATCH_SIZE = 40
+
+# デコード済みカバーはリフレッシュ後も再利用する (64MB)
+QPixmapCache.setCacheLimit(65536)
+
+
+def _scaled_pixmap(pixmap, size):
+    if pixmap.size() == size:
+        return pixmap
+
+    # 描画のたびに拡縮しないよう、表示サイズに合わせた縮小結果をキャッシュしておく
+    key = f"scaled:{pixmap.cacheKey()}:{size.width()}x{size.height()}"
+    scaled = QPixmapCache.find(key)
+    if scaled is None:
+        scaled = pixmap.scaled(
+            size,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+        QPixmapCache.insert(key, scaled)
+    return scaled
 
 
-class BookListItemWidget(QWidget):
-    def __init__(self, book, parent=None):
-        super().__init__(parent)
+def _draw_cover(painter, rect, pixmap):
+    pixmap = _scaled_pixmap(pixmap, rect.size())
+    painter.drawPixmap(
+        rect.left() + (rect.width() - pixmap.width()) // 2,
+        rect.top() + (rect.height() - pixmap.height()) // 2,
+        pixmap,
+    )
+
+
+class CoverSignals(QObject):
+    done = pyqtSignal(int, QImage)
+
+
+class CoverLoader(QRunnable):
+    def __init__(self, book, cover_size, signals, cover_data=None):
+        super().__init__()
 
         self.book = book
+        self.cover_size = cover_size
+        self.signals = signals
+        self.cover_data = cover_data
+
+    def run(self):
+        # ページの描画から縮小まですべてワーカーで行い、GUIスレッドには QImage だけを返す
+        if self.cover_data is not None:
+            image = QImage.fromData(self.cover_data)
+        else:
+            image = QImage()
+            try:
+                source = self.book.render_cover_source(thumbnail_size=self.cover_size)
+                if source is not None:
+                    img = self.book.prepare_cover_image(
+                        source, thumbnail_size=self.cover_size
+                    )
 
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(2, 2, 2, 2)
+                    # 縮小済みの画素からQImageを直接作り、JPEGの再デコードを省く
+                    image = QImage(
+                        img.tobytes(),
+                        img.width,
+                        img.height,
+                        img.width * 3,
+                        QImage.Format.Format_RGB888,
+                    ).copy()
+            except Exception as e:
+                logger.debug("Error loading cover: %s", e)
 
-        self.cover_label = QLabel()
-        self.cover_label.setFixedSize(48, 64)
-        self.cover_label.setScaledContents(True)
-        self.cover_label.setFrameShape(QFrame.Shape.Box)
+        self.signals.done.emit(self.book.id, image)
 
-        self.cover_label.setText("...")
-        self.cover_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
-        QTimer.singleShot(50, self.load_cover_image)
+class BookFetchWorker(QThread):
+    fetched = pyqtSignal(list)
 
-        layout.addWidget(self.cover_label)
+    def __init__(self, db_path, category_id, status, search_query, parent=None):
+        super().__init__(parent)
+        self.db_path = db_path
+        self.category_id = category_id
+        self.status = status
+        self.search_query = search_query
+        self.cancelled = False
+        # 取得開始時点のデータ版数 (BookFetcher がキャッシュの鮮度判定に使う)
+        self.data_version = None
+        self._db_manager = None
+
+    def run(self):
+        from controllers.library_controller import LibraryController
+        from models.database import DatabaseManager
+
+        # sqlite3の接続はスレッドをまたげないので、ワーカー専用の接続を開く
+        db_manager = DatabaseManager(self.db_path, create_tables=False)
+        self._db_manager = db_manager
+        try:
+            library_controller = LibraryController(db_manager)
+            if self.search_query:
+                book_data_list = library_controller.search_book_data(self.search_query)
+            else:
+                book_data_list = library_controller.get_all_book_data(
+                    category_id=self.category_id, status=self.status
+                )
 
-        info_layout = QVBoxLayout()
+            if not self.cancelled:
+                self.fetched.emit(book_data_list)
+        except Exception as e:
+            if not self.cancelled:
+                logger.error("Error fetching books: %s", e)
+        finally:
+            self._db_manager = None
+            db_manager.close()
+
+    def cancel(self):
+        self.cancelled = True
+
+        # 実行中のクエリを打ち切り、スレッドをすぐに終わらせる
+        # (interrupt は別スレッドから呼んでよい唯一の接続操作)
+        db_manager = self._db_manager
+        conn = db_manager.conn if db_manager is not None else None
+        if conn is not None:
+            try:
+                conn.interrupt()
+            except sqlite3.ProgrammingError:
+                pass
 
-        self.title_label = QLabel(book.title)
-        self.title_label.setStyleSheet("font-weight: bold;")
-        info_layout.addWidget(self.title_label)
 
-        author_publisher = []
-        if book.author:
-            author_publisher.append(f"by {book.author}")
-        if book.publisher:
-            author_publisher.append(f"({book.publisher})")
+class BookFetcher(QObject):
+    fetched = pyqtSignal(list)
+    # 最新の取得が結果を返さずに終わった (クエリの失敗など)
+    failed = pyqtSignal()
 
-        if author_publisher:
-            self.author_label = QLabel(" ".join(author_publisher))
-            info_layout.addWidget(self.author_label)
+    CACHE_SIZE = 8
+    CACHE_TTL = 60
 
-        if book.series_id:
-            series = book.db_manager.get_series(book.series_id)
-            if series:
-                series_text = f"Series: {series.get('name')}"
-                if book.series_order:
-                    series_text += f" #{book.series_order}"
-                self.series_label = QLabel(series_text)
-                info_layout.addWidget(self.series_label)
+    # グリッドとリストで同じ結果を使い回せるよう、キャッシュは全インスタンスで共有する
+    # (db_path, category_id, status, search_query) -> (取得時刻, データ版数, 書籍データ)
+    _cache = OrderedDict()
 
-        if book.category_id:
-            self.category_label = QLabel(f"Category: {book.category_name}")
-            self.category_label.setStyleSheet("color: green;")
-            info_layout.addWidget(self.category_label)
-        elif book.series_id and book.db_manager.get_series(book.series_id).get(
-            "category_id"
-        ):
-            series = book.db_manager.get_series(book.series_id)
-            if series and series.get("category_id"):
-                category = book.db_manager.get_category(series.get("category_id"))
-                if category:
-                    self.category_label = QLabel(
-                        f"Category: {category['name']} (from series)"
-                    )
-                    info_layout.addWidget(self.category_label)
+    def __init__(self, db_manager, parent=None):
+        super().__init__(parent)
 
-        status_text = "Unread"
-        if book.status == Book.STATUS_READING:
-            status_text = f"Reading ({book.current_page + 1}/{book.total_pages})"
-        elif book.status == Book.STATUS_COMPLETED:
-            status_text = "Completed"
+        self.db_manager = db_manager
+        self.db_path = db_manager.db_path
+
+        self._worker = None
+        # 取り消し済みを含め、まだ終了していないワーカー
+        self._workers = set()
+
+    def _data_version(self):
+        # メイン接続での書き込み件数の累計。どの画面から更新しても増えるので、
+        # 取得時から変わっていればキャッシュは古い
+        conn = self.db_manager.conn
+        return (id(conn), conn.total_changes) if conn is not None else None
 
-        self.status_label = QLabel(status_text)
-        self.status_label.setStyleSheet(
-            f"color: {self._get_status_color(book.status)};"
+    def fetch(self, category_id, status, search_query):
+        self.cancel()
+
+        key = (self.db_path, category_id, status, search_query)
+        hit = self._cache.get(key)
+        if (
+            hit
+            and time.monotonic() - hit[0] < self.CACHE_TTL
+            and hit[1] == self._data_version()
+        ):
+            self._cache.move_to_end(key)
+            self.fetched.emit(hit[2])
+            return
+
+        self._worker = BookFetchWorker(
+            self.db_path, category_id, status, search_query, parent=self
+        )
+        self._worker.data_version = self._data_version()
+        # ワーカースレッドからの通知なので、必ずGUIスレッドのイベントキュー経由で受け取る
+        self._worker.fetched.connect(
+            self._on_worker_fetched, Qt.ConnectionType.QueuedConnection
         )
-        info_layout.addWidget(self.status_label)
+        self._worker.finished.connect(self._on_worker_finished)
+        self._workers.add(self._worker)
+        self._worker.start()
+
+    def cancel(self):
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+
+    def shutdown(self):
+        # 実行中のスレッドを残したまま破棄すると異常終了するため、終わるまで待つ
+        self.cancel()
+        for worker in list(self._workers):
+            worker.cancel()
+            worker.wait()
+
+    def _on_worker_finished(self):
+        worker = self.sender()
+        self._workers.discard(worker)
+        worker.deleteLater()
+
+        # fetched は finished より先に届くので、ここで残っていれば結果は来ない
+        if worker is self._worker:
+            self._worker = None
+            self.failed.emit()
+
+    def invalidate(self):
+        self._cache.clear()
+
+    def _on_worker_fetched(self, book_data_list):
+        worker = self.sender()
+        if worker is not self._worker:
+            return
+        self._worker = None
 
-        layout.addLayout(info_layout)
-        layout.setStretch(1, 1)
+        key = (self.db_path, worker.category_id, worker.status, worker.search_query)
+        self._cache[key] = (time.monotonic(), worker.data_version, book_data_list)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
 
-    def load_cover_image(self):
-        try:
-            cover_data = self.book.get_cover_image(thumbnail_size=(48, 64))
-            if cover_data:
-                pixmap = QPixmap()
-                pixmap.loadFromData(QByteArray(cover_data))
-                self.cover_label.setPixmap(pixmap)
-            else:
-                self.cover_label.setText("No Cover")
-                self.cover_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        except Exception as e:
-            print(f"Error loading cover: {e}")
-
-    def _get_status_color(self, status):
-        if status == Book.STATUS_UNREAD:
-            return "gray"
-        elif status == Book.STATUS_READING:
-            return "blue"
-        elif status == Book.STATUS_COMPLETED:
-            return "green"
-        return "black"
-
-    def update_book_info(self, book):
-        self.book = book
+        self.fetched.emit(book_data_list)
 
-        self.title_label.setText(book.title)
 
-        if hasattr(self, "author_label"):
-            author_publisher = []
-            if book.author:
-                author_publisher.append(f"by {book.author}")
-            if book.publisher:
-                author_publisher.append(f"({book.publisher})")
+class BookListModel(QAbstractListModel):
+    # (読み込み済み件数, 全件数)
+    fetch_progress = pyqtSignal(int, int)
 
-            if author_publisher:
-                self.author_label.setText(" ".join(author_publisher))
+    BookRole = Qt.ItemDataRole.UserRole + 1
+    CoverRole = Qt.ItemDataRole.UserRole + 2
+    InfoRole = Qt.ItemDataRole.UserRole + 3
 
-        status_text = "Unread"
-        if book.status == Book.STATUS_READING:
-            status_text = f"Reading ({book.current_page + 1}/{book.total_pages})"
-        elif book.status == Book.STATUS_COMPLETED:
-            status_text = "Completed"
+    COVER_LOAD_INTERVAL = 20
+    COVERS_PER_TICK = 8
 
-        self.status_label.setText(status_text)
-        self.status_label.setStyleSheet(
-            f"color: {self._get_status_color(book.status)};"
+    def __init__(self, cover_size, batch_size=20, parent=None):
+        super().__init__(parent)
+
+        self.cover_size = cover_size
+        self.batch_size = batch_size
+
+        self._books = []
+
+        # 表示待ちの書籍は Book をまとめて作らず、ビューが要求した分だけ取り出す
+        self._pending_books = iter(())
+        self._pending_count = 0
+        self._total_count = 0
+        self._row_by_id = {}
+        self._info = {}
+        self._pending_covers = {}
+        self._loading_covers = set()
+
+        self._cover_signals = CoverSignals(self)
+        self._cover_signals.done.connect(
+            self._on_cover_loaded, Qt.ConnectionType.QueuedConnection
         )
 
+        # 要求されたカバーは1つのタイマーで少しずつ処理し、イベントループを塞がないようにする
+        self._cover_timer = QTimer(self)
+        self._cover_timer.setInterval(self.COVER_LOAD_INTERVAL)
+        self._cover_timer.timeout.connect(self._load_pending_covers)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._books)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        book = self._books[index.row()]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return book.title
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return book.title
+        if role == Qt.ItemDataRole.UserRole:
+            return book.id
+        if role == self.BookRole:
+            return book
+        if role == self.InfoRole:
+            return self._book_info(book)
+        if role == self.CoverRole:
+            # カバーは上限付きの QPixmapCache にだけ置き、追い出されたら読み直す
+            pixmap = QPixmapCache.find(self._cover_cache_key(book.id))
+            if pixmap is None:
+                self._request_cover(book.id)
+            return pixmap
+        return None
 
-class BookGridItemWidget(QWidget):
-    def __init__(self, book, parent=None):
-        super().__init__(parent)
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._pending_count > 0
 
-        self.book = book
-        self.cover_loaded = False
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
 
-        from utils.styles import StyleSheets
-        from utils.theme import AppTheme
+        started = time.perf_counter()
 
-        self.setStyleSheet(StyleSheets.GRID_ITEM_BASE)
+        batch = list(islice(self._pending_books, self.batch_size))
+        self._pending_count = self._pending_count - len(batch) if batch else 0
+        self.append_books(batch)
 
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(8, 8, 8, 8)
+        self.batch_size = _next_batch_size(
+            self.batch_size, time.perf_counter() - started
+        )
 
-        cover_width = (
-            parent.item_width - 36 if parent and hasattr(parent, "item_width") else 180
+        self.fetch_progress.emit(
+            self._total_count - self._pending_count, self._total_count
         )
-        cover_height = int(cover_width * 4 / 3)
 
-        self.cover_label = QLabel()
-        self.cover_label.setFixedSize(cover_width, cover_height)
-        self.cover_label.setScaledContents(True)
-        self.cover_label.setFrameShape(QFrame.Shape.Box)
+    def set_books(self, books, total_count):
+        # 末尾までスクロールされるたびにビューが fetchMore で次のバッチを読み込む
+        self.clear()
+
+        self._pending_books = iter(books)
+        self._pending_count = total_count
+        self._total_count = total_count
+
+        self.fetchMore()
+
+    def clear(self):
+        self.beginResetModel()
+        self._books = []
+        self._pending_books = iter(())
+        self._pending_count = 0
+        self._total_count = 0
+        self._row_by_id = {}
+        self._info = {}
+        self._pending_covers = {}
+        self._loading_covers = set()
+        self.endResetModel()
+
+    def append_books(self, books):
+        if not books:
+            return
+
+        first = len(self._books)
+        self.beginInsertRows(QModelIndex(), first, first + len(books) - 1)
+        self._books.extend(books)
+        for row, book in enumerate(books, first):
+            self._row_by_id[book.id] = row
+        self.endInsertRows()
+
+    def book_at(self, row):
+        return self._books[row]
 
-        self.cover_label.setText("Loading...")
-        self.cover_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.cover_label.setStyleSheet(StyleSheets.PLACEHOLDER)
+    def book_ids(self):
+        return [book.id for book in self._books]
 
-        layout.addWidget(self.cover_label, alignment=Qt.AlignmentFlag.AlignCenter)
+    def row_of(self, book_id):
+        return self._row_by_id.get(book_id)
+
+    def find_books(self, book_ids):
+        rows = map(self._row_by_id.get, book_ids)
+        return [self._books[row] for row in rows if row is not None]
+
+    def replace_books(self, books):
+        rows = []
+        for book in books:
+            row = self._row_by_id.get(book.id)
+            if row is None:
+                continue
+
+            old_book = self._books[row]
+            if old_book.data == book.data:
+                # 内容が同じなら表示中の Book をそのまま使い、再描画もしない
+                continue
+
+            if (old_book.file_path, old_book.data.get("cover_image")) != (
+                book.file_path,
+                book.data.get("cover_image"),
+            ):
+                self._drop_cover(book.id)
+
+            self._books[row] = book
+            self._info.pop(book.id, None)
+            rows.append(row)
+
+        if rows:
+            self.dataChanged.emit(self.index(min(rows)), self.index(max(rows)))
+
+    def update_books(self, book_ids, **fields):
+        # 値が変わらない行は再描画の対象にしない
+        rows = [
+            row
+            for row in map(self._row_by_id.get, book_ids)
+            if row is not None
+            and any(self._books[row].data.get(k) != v for k, v in fields.items())
+        ]
+        if not rows:
+            return
 
-        self.title_label = QLabel(self._truncate_text(book.title, 25))
-        self.title_label.setStyleSheet("font-weight: bold;")
-        self.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.title_label.setWordWrap(True)
-        self.title_label.setToolTip(book.title)
-        layout.addWidget(self.title_label)
+        for row in rows:
+            book = self._books[row]
+            book.update_data(**fields)
+            self._info.pop(book.id, None)
+
+        # 変更された行の範囲をまとめて1回だけ通知する
+        self.dataChanged.emit(self.index(min(rows)), self.index(max(rows)))
+
+    def remove_book(self, book_id):
+        row = self.row_of(book_id)
+        if row is None:
+            return False
+
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._books[row]
+        del self._row_by_id[book_id]
+        # 削除した行以降の行番号を詰める
+        for index in range(row, len(self._books)):
+            self._row_by_id[self._books[index].id] = index
+        self._info.pop(book_id, None)
+        self._drop_cover(book_id)
+        self.endRemoveRows()
+        return True
+
+    def _drop_cover(self, book_id):
+        QPixmapCache.remove(self._cover_cache_key(book_id))
+        # QPixmapCache だけ消しても、Book 側の縮小画像キャッシュから古い表紙が戻ってくる
+        Book.invalidate_cover(book_id)
+
+    def _book_info(self, book):
+        info = self._info.get(book.id)
+        if info is not None:
+            return info
 
+        author_publisher = []
         if book.author:
-            self.author_label = QLabel(self._truncate_text(book.author, 20))
-            self.author_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.author_label.setToolTip(book.author)
-            layout.addWidget(self.author_label)
+            author_publisher.append(f"by {book.author}")
+        if book.publisher:
+            author_publisher.append(f"({book.publisher})")
+
+        series_text = book.series_name
+        if series_text and book.series_order:
+            series_text += f" #{book.series_order}"
 
+        category_text = None
         if book.category_id:
-            self.category_label = QLabel(f"Category: {book.category_name}")
-            layout.addWidget(self.category_label)
-        elif book.series_id and book.db_manager.get_series(book.series_id).get(
-            "category_id"
-        ):
-            series = book.db_manager.get_series(book.series_id)
-            if series and series.get("category_id"):
-                category = book.db_manager.get_category(series.get("category_id"))
-                if category:
-                    self.category_label = QLabel(
-                        f"Category: {category['name']} (from series)"
-                    )
-                    layout.addWidget(self.category_label)
+            category_text = f"Category: {book.category_name}"
+        elif book.series_category_name:
+            category_text = f"Category: {book.series_category_name} (from series)"
 
-        status_text = "Unread"
+        # 表示文言は行ごとに一度だけ組み立て、描画のたびに整形しない
+        progress = 0
+        status_text = short_status_text = book.status_name
         if book.status == Book.STATUS_READING:
-            progress = (
-                int((book.current_page + 1) / book.total_pages * 100)
-                if book.total_pages > 0
-                else 0
-            )
-            status_text = f"Reading {progress}%"
-        elif book.status == Book.STATUS_COMPLETED:
-            status_text = "Completed"
-        self.status_label = QLabel(status_text)
-        self.status_label.setStyleSheet(StyleSheets.reading_status_style(book.status))
-        self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(self.status_label)
-
-        if book.series_id:
-            series = book.db_manager.get_series(book.series_id)
-            if series:
-                series_text = series.get("name")
-                if book.series_order:
-                    series_text += f" #{book.series_order}"
-                self.series_badge = QLabel(self._truncate_text(series_text, 20))
-                self.series_badge.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.series_badge.setStyleSheet(
-                    "background-color: #e0e0e0; border-radius: 3px; padding: 2px;"
+            total_pages = book.total_pages
+            if total_pages > 0:
+                progress = int((book.current_page + 1) / total_pages * 100)
+            status_text = f"{status_text} ({book.current_page + 1}/{total_pages})"
+            short_status_text = f"{short_status_text} {progress}%"
+
+        info = {
+            "author": " ".join(author_publisher) or None,
+            "series": series_text,
+            "category": category_text,
+            "from_series": not book.category_id,
+            "status": book.status,
+            "status_text": status_text,
+            "short_status_text": short_status_text,
+            "progress": progress,
+        }
+        self._info[book.id] = info
+        return info
+
+    def _request_cover(self, book_id):
+        if book_id in self._pending_covers or book_id in self._loading_covers:
+            return
+
+        self._pending_covers[book_id] = None
+        if not self._cover_timer.isActive():
+            self._cover_timer.start()
+
+    def _load_pending_covers(self):
+        pending = self._pending_covers
+        book_ids = list(islice(pending, self.COVERS_PER_TICK))
+        for book_id in book_ids:
+            del pending[book_id]
+        if not pending:
+            self._cover_timer.stop()
+
+        pool = QThreadPool.globalInstance()
+        for book_id in book_ids:
+            row = self.row_of(book_id)
+            if row is None:
+                continue
+
+            # PDFの描画を含め、重い処理はすべてワーカーに任せる
+            book = self._books[row]
+            cover_data = book.get_cached_cover_image(thumbnail_size=self.cover_size)
+            if cover_data is None and not book.exists():
+                self._set_cover(book_id, None)
+                continue
+
+            self._loading_covers.add(book_id)
+            pool.start(
+                CoverLoader(
+                    book, self.cover_size, self._cover_signals, cover_data=cover_data
                 )
-                self.series_badge.setToolTip(series_text)
-                self.series_badge.setStyleSheet(StyleSheets.SERIES_BADGE)
-                layout.addWidget(self.series_badge)
-
-    def _truncate_text(self, text, max_length):
-        if len(text) > max_length:
-            return text[: max_length - 3] + "..."
-        return text
-
-    def _get_status_color(self, status):
-        if status == Book.STATUS_UNREAD:
-            return "gray"
-        elif status == Book.STATUS_READING:
-            return "blue"
-        elif status == Book.STATUS_COMPLETED:
-            return "green"
-        return "black"
-
-    def update_book_info(self, book):
-        self.book = book
+            )
+
+    def _on_cover_loaded(self, book_id, image):
+        if book_id not in self._loading_covers:
+            return
+        self._loading_covers.discard(book_id)
 
-        self.title_label.setText(self._truncate_text(book.title, 25))
-        self.title_label.setToolTip(book.title)
+        if self.row_of(book_id) is None:
+            return
 
-        if hasattr(self, "author_label") and book.author:
-            self.author_label.setText(self._truncate_text(book.author, 20))
-            self.author_label.setToolTip(book.author)
+        self._set_cover(book_id, None if image.isNull() else QPixmap.fromImage(image))
 
-        status_text = "Unread"
-        if book.status == Book.STATUS_READING:
-            progress = (
-                int((book.current_page + 1) / book.total_pages * 100)
-                if book.total_pages > 0
-                else 0
+    def _cover_cache_key(self, book_id):
+        return f"cover:{book_id}:{self.cover_size[0]}x{self.cover_size[1]}"
+
+    def _set_cover(self, book_id, pixmap):
+        if pixmap is None:
+            pixmap = get_placeholder_pixmap("No Cover", *self.cover_size)
+        QPixmapCache.insert(self._cover_cache_key(book_id), pixmap)
+
+        row = self.row_of(book_id)
+        if row is not None:
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [self.CoverRole])
+
+
+class BookListDelegate(QStyledItemDelegate):
+    COVER_SIZE = QSize(48, 64)
+    MARGIN = 2
+    SPACING = 6
+
+    _STATUS_COLORS = {
+        Book.STATUS_UNREAD: QColor("gray"),
+        Book.STATUS_READING: QColor("blue"),
+        Book.STATUS_COMPLETED: QColor("green"),
+    }
+    _CATEGORY_COLOR = QColor("green")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self._title_font = QFont(parent.font() if parent else QFont())
+        self._title_font.setBold(True)
+        self._title_metrics = QFontMetrics(self._title_font)
+
+        # 全行が同じ高さなので、行の高さは行間ごとに一度だけ計算する
+        self._row_heights = {}
+
+    def sizeHint(self, option, index):
+        line_height = option.fontMetrics.lineSpacing()
+        height = self._row_heights.get(line_height)
+        if height is None:
+            height = max(
+                self.COVER_SIZE.height() + self.MARGIN * 2,
+                line_height * 5 + self.MARGIN * 2,
+            )
+            self._row_heights[line_height] = height
+        return QSize(option.rect.width(), height)
+
+    def paint(self, painter, option, index):
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        style.drawControl(
+            QStyle.ControlElement.CE_ItemViewItem, opt, painter, opt.widget
+        )
+
+        rect = option.rect
+        info = index.data(BookListModel.InfoRole)
+
+        painter.save()
+
+        cover_rect = QRect(
+            rect.left() + self.MARGIN,
+            rect.top() + self.MARGIN,
+            self.COVER_SIZE.width(),
+            self.COVER_SIZE.height(),
+        )
+        pixmap = index.data(BookListModel.CoverRole)
+        if pixmap is None:
+            pixmap = get_placeholder_pixmap(
+                "...", self.COVER_SIZE.width(), self.COVER_SIZE.height()
             )
-            status_text = f"Reading {progress}%"
-        elif book.status == Book.STATUS_COMPLETED:
-            status_text = "Completed"
+        _draw_cover(painter, cover_rect, pixmap)
+        painter.setPen(option.palette.color(QPalette.ColorRole.Mid))
+        painter.drawRect(cover_rect.adjusted(0, 0, -1, -1))
+
+        text_left = cover_rect.right() + self.SPACING
+        text_width = rect.right() - text_left - self.MARGIN
+        line_height = option.fontMetrics.lineSpacing()
+        y = rect.top() + self.MARGIN
+
+        text_color = option.palette.color(
+            QPalette.ColorRole.HighlightedText
+            if option.state & QStyle.StateFlag.State_Selected
+            else QPalette.ColorRole.Text
+        )
 
-        self.status_label.setText(status_text)
-        self.status_label.setStyleSheet(
-            f"color: {self._get_status_color(book.status)};"
+        title_style = (self._title_font, self._title_metrics)
+        text_style = (option.font, option.fontMetrics)
+
+        lines = [(index.data(Qt.ItemDataRole.DisplayRole), title_style, text_color)]
+        if info["author"]:
+            lines.append((info["author"], text_style, text_color))
+        if info["series"]:
+            lines.append((f"Series: {info['series']}", text_style, text_color))
+        if info["category"]:
+            category_color = text_color if info["from_series"] else self._CATEGORY_COLOR
+            lines.append((info["category"], text_style, category_color))
+        lines.append(
+            (
+                info["status_text"],
+                text_style,
+                self._STATUS_COLORS.get(info["status"], text_color),
+            )
         )
 
-    def load_cover_image(self):
-        if self.cover_loaded:
-            return
+        for text, (font, metrics), color in lines:
+            painter.setFont(font)
+            painter.setPen(color)
+            painter.drawText(
+                QRect(text_left, y, text_width, line_height),
+                Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                metrics.elidedText(text, Qt.TextElideMode.ElideRight, text_width),
+            )
+            y += line_height
 
-        try:
-            cover_data = self.book.get_cover_image(thumbnail_size=(150, 200))
-            if cover_data:
-                pixmap = QPixmap()
-                pixmap.loadFromData(QByteArray(cover_data))
-                self.cover_label.setPixmap(pixmap)
-                self.cover_loaded = True
-            else:
-                self.cover_label.setText("No Cover")
-                self.cover_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.cover_loaded = True
-        except Exception as e:
-            print(f"Error loading cover: {e}")
-            self.cover_label.setText("Error")
-            self.cover_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.cover_loaded = True  # エラーでも読み込み完了とマーク
+        painter.restore()
+
+
+class BookGridDelegate(QStyledItemDelegate):
+    PADDING = 8
+    LINE_SPACING = 4
+
+    _STATUS_COLORS = {
+        Book.STATUS_UNREAD: QColor(AppTheme.STATUS_UNREAD),
+        Book.STATUS_READING: QColor(AppTheme.STATUS_READING),
+        Book.STATUS_COMPLETED: QColor(AppTheme.STATUS_COMPLETED),
+    }
+    _DEFAULT_STATUS_COLOR = QColor(AppTheme.TEXT_PRIMARY)
+    _CARD_COLOR = QColor(AppTheme.SURFACE)
+    _SELECTED_CARD_COLOR = QColor(AppTheme.SELECTION_BACKGROUND)
+    _SELECTED_BORDER_COLOR = QColor(AppTheme.SELECTION_BORDER)
+    _BADGE_COLOR = QColor(AppTheme.PRIMARY_LIGHT)
+    _BADGE_TEXT_COLOR = QColor("white")
 
-    def enterEvent(self, event):
-        if not self.cover_loaded:
-            QTimer.singleShot(10, self.load_cover_image)
-        super().enterEvent(event)
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self._bold_font = QFont(parent.font() if parent else QFont())
+        self._bold_font.setBold(True)
+        self._bold_metrics = QFontMetrics(self._bold_font)
+
+        # 全アイテムが同じサイズなので、アイテム幅と行間ごとに一度だけ計算する
+        self._item_sizes = {}
+
+    def item_size(self, item_width, font_metrics):
+        key = (item_width, font_metrics.lineSpacing())
+        size = self._item_sizes.get(key)
+        if size is None:
+            cover_width = item_width - 36
+            cover_height = int(cover_width * 4 / 3)
+            line_height = font_metrics.lineSpacing() + self.LINE_SPACING
+            size = QSize(item_width, cover_height + self.PADDING * 3 + line_height * 5)
+            self._item_sizes[key] = size
+        return size
+
+    def sizeHint(self, option, index):
+        return self.item_size(self.parent().item_width, option.fontMetrics)
+
+    def paint(self, painter, option, index):
+        view = self.parent()
+        info = index.data(BookListModel.InfoRole)
+        selected = index.data(Qt.ItemDataRole.UserRole) in view.selected_book_ids
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        card_rect = QRectF(option.rect).adjusted(0.5, 0.5, -0.5, -0.5)
+        if selected:
+            painter.setPen(self._SELECTED_BORDER_COLOR)
+            painter.setBrush(self._SELECTED_CARD_COLOR)
+        else:
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(self._CARD_COLOR)
+        painter.drawRoundedRect(card_rect, 4, 4)
+
+        rect = option.rect.adjusted(
+            self.PADDING, self.PADDING, -self.PADDING, -self.PADDING
+        )
+
+        cover_width = option.rect.width() - 36
+        cover_height = int(cover_width * 4 / 3)
+        cover_rect = QRect(
+            rect.left() + (rect.width() - cover_width) // 2,
+            rect.top(),
+            cover_width,
+            cover_height,
+        )
+        pixmap = index.data(BookListModel.CoverRole)
+        if pixmap is None:
+            pixmap = get_placeholder_pixmap("Loading...", cover_width, cover_height)
+        _draw_cover(painter, cover_rect, pixmap)
+        painter.setPen(option.palette.color(QPalette.ColorRole.Mid))
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawRect(cover_rect.adjusted(0, 0, -1, -1))
+
+        text_color = option.palette.color(QPalette.ColorRole.Text)
+        line_height = option.fontMetrics.lineSpacing() + self.LINE_SPACING
+        y = cover_rect.bottom() + self.PADDING
+
+        bold_style = (self._bold_font, self._bold_metrics)
+        text_style = (option.font, option.fontMetrics)
+
+        lines = [(index.data(Qt.ItemDataRole.DisplayRole), bold_style, text_color)]
+        if info["author"]:
+            lines.append((info["author"], text_style, text_color))
+        if info["category"]:
+            lines.append((info["category"], text_style, text_color))
+        lines.append(
+            (
+                info["short_status_text"],
+                bold_style,
+                self._STATUS_COLORS.get(info["status"], self._DEFAULT_STATUS_COLOR),
+            )
+        )
 
+        for text, (font, metrics), color in lines:
+            painter.setFont(font)
+            painter.setPen(color)
+            painter.drawText(
+                QRect(rect.left(), y, rect.width(), line_height),
+                Qt.AlignmentFlag.AlignCenter,
+                metrics.elidedText(text, Qt.TextElideMode.ElideRight, rect.width()),
+            )
+            y += line_height
 
-class LibraryGridView(QScrollArea):
+        if info["series"]:
+            painter.setFont(option.font)
+            metrics = option.fontMetrics
+            badge_text = metrics.elidedText(
+                info["series"], Qt.TextElideMode.ElideRight, rect.width() - 16
+            )
+            badge_width = metrics.horizontalAdvance(badge_text) + 16
+            badge_rect = QRectF(
+                rect.left() + (rect.width() - badge_width) / 2,
+                y + 1,
+                badge_width,
+                line_height - 2,
+            )
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(self._BADGE_COLOR)
+            painter.drawRoundedRect(
+                badge_rect, badge_rect.height() / 2, badge_rect.height() / 2
+            )
+            painter.setPen(self._BADGE_TEXT_COLOR)
+            painter.drawText(badge_rect, Qt.AlignmentFlag.AlignCenter, badge_text)
+
+        painter.restore()
+
+
+def _next_batch_size(batch_size, elapsed):
+    # 1フレーム (約16ms) に収まらなかったら次の読み込みを半分にし、収まれば少しずつ増やす
+    if elapsed > 0.016:
+        return max(MIN_BATCH_SIZE, batch_size // 2)
+    return min(MAX_BATCH_SIZE, batch_size + 5)
+
+
+@lru_cache(maxsize=16)
+def _compute_grid_layout(
+    viewport_width,
+    spacing,
+    horizontal_margins,
+    min_columns,
+    max_columns,
+    min_item_width,
+    preferred_item_width,
+    max_item_width,
+):
+    available_width = viewport_width - horizontal_margins - 20
+
+    columns = max(
+        min_columns,
+        min(
+            max_columns,
+            (available_width + spacing) // (preferred_item_width + spacing),
+        ),
+    )
+
+    item_width = max(
+        min_item_width,
+        min(
+            max_item_width,
+            (available_width - (columns - 1) * spacing) // columns,
+        ),
+    )
+
+    return columns, item_width
+
+
+class LibraryGridView(QListView):
     book_selected = pyqtSignal(int)
     books_selected = pyqtSignal(list)
 
+    _PLACEHOLDER_COLOR = QColor("gray")
+
+    # これ以下の行数なら、ビューポート全体ではなく行ごとに再描画する
+    _ROW_UPDATE_LIMIT = 16
+
     def __init__(self, library_controller, parent=None):
         super().__init__(parent)
 
         self.library_controller = library_controller
 
-        self.setWidgetResizable(True)
-
-        self.content_widget = QWidget()
-        self.setWidget(self.content_widget)
-
-        self.grid_layout = QGridLayout(self.content_widget)
-        self.grid_layout.setSpacing(12)
-        self.grid_layout.setContentsMargins(15, 15, 15, 15)
-
         self.min_columns = 2
         self.max_columns = 8
         self.ideal_columns = 5
         self.min_item_width = 160
         self.preferred_item_width = 200
         self.max_item_width = 260
-
-        self.grid_columns = self.ideal_columns
-        self.item_width = self.preferred_item_width
+        self.item_spacing = 12
+        self.grid_margins = 15
 
         self.selected_book_id = None
 
-        self.selected_book_ids = set()
+        # dict をinsertion-orderedなsetとして使い、最後に選択した書籍を O(1) で取得する
+        self.selected_book_ids = {}
 
         self.multi_select_mode = False
 
@@ -349,31 +895,60 @@ class LibraryGridView(QScrollArea):
         self.status_filter = None
         self.search_query = None
 
-        self.book_widgets = {}
-
-        self.all_books = []
-        self.loaded_count = 0
-        self.batch_size = 20
-        self.is_loading = False
-        self.loading_timer = None
-        self.visible_widgets = set()
+        # 現在表示中の一覧がどのフィルタ条件で取得したものか (show_books 表示中は None)
+        self._shown_filters = None
 
         self.grid_columns = 3
         self.item_width = 190
         self.last_viewport_width = 0
 
-        self.verticalScrollBar().valueChanged.connect(self.check_scroll_position)
+        self.placeholder_text = "Loading books..."
+
+        self.book_fetcher = BookFetcher(self.library_controller.db_manager, parent=self)
+        self.book_fetcher.fetched.connect(self._on_books_fetched)
+
+        self.model = BookListModel(cover_size=(150, 200), batch_size=20, parent=self)
+        self.model.fetch_progress.connect(self._on_fetch_progress)
+        self.setModel(self.model)
+        self.setItemDelegate(BookGridDelegate(self))
+
+        self.setViewMode(QListView.ViewMode.IconMode)
+        self.setMovement(QListView.Movement.Static)
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+        self.setWrapping(True)
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListView.LayoutMode.Batched)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setViewportMargins(
+            self.grid_margins, self.grid_margins, self.grid_margins, 0
+        )
+        self.viewport().setCursor(Qt.CursorShape.PointingHandCursor)
+
+        self._build_context_menus()
+
+        # ドラッグ中のリサイズは最後の幅だけでグリッドを組み直す
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(self._apply_resize)
 
-        self.installEventFilter(self)
+        self.relayout_grid()
 
-        self.placeholder = QLabel("Loading books...")
-        self.placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.placeholder.setStyleSheet("color: gray; font-size: 16px;")
-        self.grid_layout.addWidget(self.placeholder, 0, 0)
+        # 連続したレイアウト要求は1回の再計算にまとめる
+        self._layout_timer = QTimer(self)
+        self._layout_timer.setSingleShot(True)
+        self._layout_timer.setInterval(100)
+        self._layout_timer.timeout.connect(self._do_ensure_layout)
+        self._saved_columns = None
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
 
+        if self.viewport().width() != self.last_viewport_width:
+            self._resize_timer.start()
+
+    def _apply_resize(self):
         current_width = self.viewport().width()
 
         if current_width == self.last_viewport_width:
@@ -381,38 +956,42 @@ class LibraryGridView(QScrollArea):
 
         self.last_viewport_width = current_width
 
-        self.calculate_grid_columns()
-
-        if self.book_widgets:
+        if self.calculate_grid_columns():
             self.relayout_grid()
 
-    def eventFilter(self, obj, event):
-        if event.type() == QEvent.Type.Show:
-            QTimer.singleShot(100, self.update_visible_widgets)
-        return super().eventFilter(obj, event)
-
-    def calculate_grid_columns(self):
-        viewport_width = self.viewport().width()
-
-        margins = self.grid_layout.contentsMargins()
-        available_width = viewport_width - margins.left() - margins.right() - 20
+    def paintEvent(self, event):
+        super().paintEvent(event)
+
+        if self.placeholder_text and self.model.rowCount() == 0:
+            painter = QPainter(self.viewport())
+            font = QFont(self.font())
+            font.setPixelSize(16)
+            painter.setFont(font)
+            painter.setPen(self._PLACEHOLDER_COLOR)
+            painter.drawText(
+                self.viewport().rect(),
+                Qt.AlignmentFlag.AlignCenter,
+                self.placeholder_text,
+            )
+            painter.end()
 
-        spacing = self.grid_layout.spacing()
+    def mousePressEvent(self, event):
+        index = self.indexAt(event.position().toPoint())
+        if index.isValid():
+            self._on_book_clicked(event, index.data(Qt.ItemDataRole.UserRole))
+            return
+        super().mousePressEvent(event)
 
-        columns = max(
+    def calculate_grid_columns(self):
+        columns, item_width = _compute_grid_layout(
+            self.viewport().width() + self.grid_margins * 2,
+            self.item_spacing,
+            self.grid_margins * 2,
             self.min_columns,
-            min(
-                self.max_columns,
-                (available_width + spacing) // (self.preferred_item_width + spacing),
-            ),
-        )
-
-        item_width = max(
+            self.max_columns,
             self.min_item_width,
-            min(
-                self.max_item_width,
-                (available_width - (columns - 1) * spacing) // columns,
-            ),
+            self.preferred_item_width,
+            self.max_item_width,
         )
 
         layout_changed = False
@@ -426,158 +1005,66 @@ class LibraryGridView(QScrollArea):
 
         return layout_changed
 
-    def calculate_ideal_item_width(self):
-        viewport_width = self.viewport().width()
-        spacing = 10
-
-        target_columns = 4
-
-        ideal_width = (
-            viewport_width - 20 - (target_columns - 1) * spacing
-        ) // target_columns
-
-        min_width = 150
-        max_width = 250
-        return max(min_width, min(max_width, ideal_width))
-
     def relayout_grid(self):
-        widgets = []
-        for book_id, widget in self.book_widgets.items():
-            self.grid_layout.removeWidget(widget)
-            widgets.append((book_id, widget))
-
-        for i, (book_id, widget) in enumerate(widgets):
-            row = i // self.grid_columns
-            col = i % self.grid_columns
-            self.grid_layout.addWidget(widget, row, col)
+        item_size = self.itemDelegate().item_size(self.item_width, self.fontMetrics())
+        self.setGridSize(
+            QSize(
+                item_size.width() + self.item_spacing,
+                item_size.height() + self.item_spacing,
+            )
+        )
+        self.scheduleDelayedItemsLayout()
 
-        self.content_widget.updateGeometry()
+    def refresh(self, use_cache=False):
+        # フィルタ切り替え以外の再読み込みはデータ変更を伴うので、キャッシュを破棄する
+        if not use_cache:
+            self.book_fetcher.invalidate()
 
-        QTimer.singleShot(50, self.update_visible_widgets)
+        self._shown_filters = (
+            self.category_filter,
+            self.status_filter,
+            self.search_query,
+        )
 
-    def refresh(self):
         self._clear_grid()
 
-        self.loaded_count = 0
-
-        self.placeholder = QLabel("Loading books...")
-        self.placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.placeholder.setStyleSheet("color: gray; font-size: 16px;")
-        self.grid_layout.addWidget(self.placeholder, 0, 0)
+        self.placeholder_text = "Loading books..."
+        self.viewport().update()
 
-        QTimer.singleShot(50, self._load_books_async)
+        self._load_books_async()
 
     def _load_books_async(self):
-        self.all_books = self._get_filtered_books()
-
-        if self.placeholder.parent() == self.content_widget:
-            self.placeholder.setParent(None)
-            self.placeholder.deleteLater()
-
-        self.calculate_grid_columns()
-
-        self.load_more_books()
-
-    def load_more_books(self):
-        if self.is_loading or self.loaded_count >= len(self.all_books):
-            return
-
-        self.is_loading = True
-
-        start_idx = self.loaded_count
-        end_idx = min(start_idx + self.batch_size, len(self.all_books))
-
-        for i in range(start_idx, end_idx):
-            book = self.all_books[i]
-            row = i // self.grid_columns
-            col = i % self.grid_columns
-
-            book_widget = BookGridItemWidget(book, self)
-            book_widget.setFixedWidth(self.item_width)
-            book_widget.setCursor(Qt.CursorShape.PointingHandCursor)
-            book_widget.mousePressEvent = (
-                lambda event, b=book.id: self._on_book_clicked(event, b)
-            )
+        self.book_fetcher.fetch(
+            self.category_filter, self.status_filter, self.search_query
+        )
 
-            self.grid_layout.addWidget(book_widget, row, col)
+    def _on_books_fetched(self, book_data_list):
+        db_manager = self.library_controller.db_manager
 
-            self.book_widgets[book.id] = book_widget
+        self.placeholder_text = None
 
-        self.loaded_count = end_idx
+        self.calculate_grid_columns()
 
-        self.is_loading = False
+        self.model.set_books(
+            (Book(data, db_manager) for data in book_data_list), len(book_data_list)
+        )
 
-        if self.loaded_count < len(self.all_books):
+    def _on_fetch_progress(self, loaded_count, total_count):
+        if loaded_count < total_count:
             try:
                 main_window = self.window()
                 if main_window and hasattr(main_window, "statusBar"):
                     main_window.statusBar.showMessage(
-                        f"Loaded {self.loaded_count} of {len(self.all_books)} books"
+                        f"Loaded {loaded_count} of {total_count} books"
                     )
             except Exception as e:
-                print(f"Error updating status bar: {e}")
-
-        QTimer.singleShot(50, self.update_visible_widgets)
-
-    def update_visible_widgets(self):
-        if not self.book_widgets:
-            return
-
-        viewport_rect = self.viewport().rect()
-        scrollbar_value = self.verticalScrollBar().value()
-
-        visible_top = scrollbar_value
-        visible_bottom = scrollbar_value + viewport_rect.height()
-
-        new_visible_widgets = set()
-
-        for book_id, widget in self.book_widgets.items():
-            widget_pos = widget.mapTo(self.content_widget, QPoint(0, 0))
-            widget_top = widget_pos.y()
-            widget_bottom = widget_top + widget.height()
-
-            if widget_bottom >= visible_top and widget_top <= visible_bottom:
-                new_visible_widgets.add(book_id)
-
-                if isinstance(widget, BookGridItemWidget) and not widget.cover_loaded:
-                    QTimer.singleShot(10, widget.load_cover_image)
-
-        self.visible_widgets = new_visible_widgets
-
-    def check_scroll_position(self, value):
-        scrollbar = self.verticalScrollBar()
-        if value > scrollbar.maximum() * 0.7:
-            self.load_more_books()
-
-        if self.loading_timer:
-            self.loading_timer.stop()
-
-        self.loading_timer = QTimer()
-        self.loading_timer.setSingleShot(True)
-        self.loading_timer.timeout.connect(self.update_visible_widgets)
-        self.loading_timer.start(100)
+                logger.debug("Error updating status bar: %s", e)
 
     def _clear_grid(self):
-        while self.grid_layout.count():
-            item = self.grid_layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
-
-        self.book_widgets = {}
-        self.selected_book_ids = set()
-        self.selected_book_id = None
-        self.visible_widgets = set()
-
-    def _get_filtered_books(self):
-        if self.search_query:
-            base_books = self.library_controller.search_books(self.search_query)
-        else:
-            base_books = self.library_controller.get_all_books(
-                category_id=self.category_filter, status=self.status_filter
-            )
+        self.model.clear()
 
-        return base_books
+        self.selected_book_ids = {}
+        self.selected_book_id = None
 
     def _on_book_clicked(self, event, book_id):
         if event.button() == Qt.MouseButton.RightButton:
@@ -590,20 +1077,17 @@ class LibraryGridView(QScrollArea):
             shift_pressed = event.modifiers() & Qt.KeyboardModifier.ShiftModifier
 
             if shift_pressed and self.selected_book_ids:
-                last_id = (
-                    list(self.selected_book_ids)[-1]
-                    if self.selected_book_ids
-                    else book_id
-                )
-                all_ids = list(self.book_widgets.keys())
-                try:
-                    start_idx = all_ids.index(last_id)
-                    end_idx = all_ids.index(book_id)
+                last_id = next(reversed(self.selected_book_ids))
+                start_idx = self.model.row_of(last_id)
+                end_idx = self.model.row_of(book_id)
+                if start_idx is not None and end_idx is not None:
                     if start_idx > end_idx:
                         start_idx, end_idx = end_idx, start_idx
                     for idx in range(start_idx, end_idx + 1):
-                        self._select_book(all_ids[idx], add_to_selection=True)
-                except ValueError:
+                        self._select_book(
+                            self.model.book_at(idx).id, add_to_selection=True
+                        )
+                else:
                     if not ctrl_pressed:
                         self._clear_selection()
                     self._select_book(book_id, add_to_selection=True)
@@ -618,192 +1102,219 @@ class LibraryGridView(QScrollArea):
 
             self.books_selected.emit(list(self.selected_book_ids))
         else:
-            self._clear_selection()
-            self._select_book(book_id)
-            self.selected_book_id = book_id
+            if not self._is_sole_selection(book_id):
+                self._select_book(book_id)
+                self.selected_book_id = book_id
             self.book_selected.emit(book_id)
 
     def set_status_filter(self, status):
+        if self._filters_unchanged(self.category_filter, status, None):
+            return
+
         self.status_filter = status
         self.search_query = None  # 検索クエリをクリア
-        self.refresh()
+        self.refresh(use_cache=True)
 
-    def _show_context_menu(self, position, book_id):
-        menu = QMenu()
+    def _filters_unchanged(self, category_id, status, search_query):
+        # 同じ条件での再選択は一覧を作り直さない (条件が変わったときは丸ごと作り直す)
+        return self._shown_filters == (category_id, status, search_query)
 
-        is_multiple_selected = len(self.selected_book_ids) > 1
+    def _build_context_menus(self):
+        # メニューは一度だけ構築し、表示時に対象の書籍IDだけを差し替える
+        self._context_book_id = None
+        self._context_book_ids = []
 
-        if is_multiple_selected and book_id in self.selected_book_ids:
-            selection_count = len(self.selected_book_ids)
-            menu.addAction(f"{selection_count} books selected")
-            menu.addSeparator()
+        self._context_menu = QMenu(self)
 
-            edit_action = QAction("Edit Selected Books", self)
-            edit_action.triggered.connect(
-                lambda: self._batch_edit_metadata(list(self.selected_book_ids))
-            )
-            menu.addAction(edit_action)
+        open_action = QAction("Open", self)
+        open_action.triggered.connect(
+            lambda: self.book_selected.emit(self._context_book_id)
+        )
+        self._context_menu.addAction(open_action)
 
-            add_to_series_action = QAction("Add Selected to Series", self)
-            add_to_series_action.triggered.connect(
-                lambda: self._batch_add_to_series(list(self.selected_book_ids))
-            )
-            menu.addAction(add_to_series_action)
+        self._context_menu.addSeparator()
 
-            remove_from_series_action = QAction("Remove Selected from Series", self)
-            remove_from_series_action.triggered.connect(
-                lambda: self._batch_remove_from_series(list(self.selected_book_ids))
-            )
-            menu.addAction(remove_from_series_action)
+        edit_action = QAction("Edit Metadata", self)
+        edit_action.triggered.connect(
+            lambda: self._edit_metadata(self._context_book_id)
+        )
+        self._context_menu.addAction(edit_action)
 
-            menu.addSeparator()
+        self._add_to_series_action = QAction("Add to Series", self)
+        self._add_to_series_action.triggered.connect(
+            lambda: self._add_to_series(self._context_book_id)
+        )
+        self._context_menu.addAction(self._add_to_series_action)
 
-            mark_action = QMenu("Mark Selected as", menu)
+        self._remove_from_series_action = QAction("Remove from Series", self)
+        self._remove_from_series_action.triggered.connect(
+            lambda: self._remove_from_series(self._context_book_id)
+        )
+        self._context_menu.addAction(self._remove_from_series_action)
 
-            unread_action = QAction("Unread", self)
-            unread_action.triggered.connect(
-                lambda: self._batch_mark_as_status(
-                    list(self.selected_book_ids), Book.STATUS_UNREAD
-                )
-            )
-            mark_action.addAction(unread_action)
+        self._context_menu.addSeparator()
 
-            reading_action = QAction("Reading", self)
-            reading_action.triggered.connect(
-                lambda: self._batch_mark_as_status(
-                    list(self.selected_book_ids), Book.STATUS_READING
-                )
-            )
-            mark_action.addAction(reading_action)
+        mark_action = QMenu("Mark as", self._context_menu)
 
-            completed_action = QAction("Completed", self)
-            completed_action.triggered.connect(
-                lambda: self._batch_mark_as_status(
-                    list(self.selected_book_ids), Book.STATUS_COMPLETED
-                )
-            )
-            mark_action.addAction(completed_action)
+        for status, text in MARK_AS_STATUSES:
+            action = QAction(text, self)
+            action.setData(status)
+            action.triggered.connect(self._on_mark_triggered)
+            mark_action.addAction(action)
 
-            menu.addMenu(mark_action)
+        self._context_menu.addMenu(mark_action)
 
-            menu.addSeparator()
+        self._context_menu.addSeparator()
 
-            remove_action = QAction("Remove Selected from Library", self)
-            remove_action.triggered.connect(
-                lambda: self._batch_remove_books(list(self.selected_book_ids))
-            )
-            menu.addAction(remove_action)
-        else:
-            open_action = QAction("Open", self)
-            open_action.triggered.connect(lambda: self.book_selected.emit(book_id))
-            menu.addAction(open_action)
+        self._toggle_selection_action = QAction("", self)
+        self._toggle_selection_action.triggered.connect(
+            lambda: self._toggle_context_selection(self._context_book_id)
+        )
+        self._context_menu.addAction(self._toggle_selection_action)
 
-            menu.addSeparator()
+        self._toggle_selection_separator = self._context_menu.addSeparator()
 
-            edit_action = QAction("Edit Metadata", self)
-            edit_action.triggered.connect(lambda: self._edit_metadata(book_id))
-            menu.addAction(edit_action)
+        remove_action = QAction("Remove from Library", self)
+        remove_action.triggered.connect(
+            lambda: self._remove_book(self._context_book_id)
+        )
+        self._context_menu.addAction(remove_action)
 
-            if self.library_controller.get_book(book_id).series_id is None:
-                add_to_series_action = QAction("Add to Series", self)
-                add_to_series_action.triggered.connect(
-                    lambda: self._add_to_series(book_id)
-                )
-                menu.addAction(add_to_series_action)
-            else:
-                remove_from_series_action = QAction("Remove from Series", self)
-                remove_from_series_action.triggered.connect(
-                    lambda: self._remove_from_series(book_id)
-                )
-                menu.addAction(remove_from_series_action)
+        self._batch_context_menu = QMenu(self)
 
-            menu.addSeparator()
+        self._selection_count_action = self._batch_context_menu.addAction("")
+        self._batch_context_menu.addSeparator()
 
-            mark_action = QMenu("Mark as", menu)
+        edit_action = QAction("Edit Selected Books", self)
+        edit_action.triggered.connect(
+            lambda: self._batch_edit_metadata(self._context_book_ids)
+        )
+        self._batch_context_menu.addAction(edit_action)
 
-            unread_action = QAction("Unread", self)
-            unread_action.triggered.connect(
-                lambda: self._mark_as_status(book_id, Book.STATUS_UNREAD)
-            )
-            mark_action.addAction(unread_action)
+        add_to_series_action = QAction("Add Selected to Series", self)
+        add_to_series_action.triggered.connect(
+            lambda: self._batch_add_to_series(self._context_book_ids)
+        )
+        self._batch_context_menu.addAction(add_to_series_action)
 
-            reading_action = QAction("Reading", self)
-            reading_action.triggered.connect(
-                lambda: self._mark_as_status(book_id, Book.STATUS_READING)
-            )
-            mark_action.addAction(reading_action)
+        remove_from_series_action = QAction("Remove Selected from Series", self)
+        remove_from_series_action.triggered.connect(
+            lambda: self._batch_remove_from_series(self._context_book_ids)
+        )
+        self._batch_context_menu.addAction(remove_from_series_action)
+
+        self._batch_context_menu.addSeparator()
+
+        mark_action = QMenu("Mark Selected as", self._batch_context_menu)
+
+        for status, text in MARK_AS_STATUSES:
+            action = QAction(text, self)
+            action.setData(status)
+            action.triggered.connect(self._on_batch_mark_triggered)
+            mark_action.addAction(action)
+
+        self._batch_context_menu.addMenu(mark_action)
+
+        self._batch_context_menu.addSeparator()
+
+        remove_action = QAction("Remove Selected from Library", self)
+        remove_action.triggered.connect(
+            lambda: self._batch_remove_books(self._context_book_ids)
+        )
+        self._batch_context_menu.addAction(remove_action)
+
+    def _on_mark_triggered(self):
+        self._mark_as_status(self._context_book_id, self.sender().data())
+
+    def _on_batch_mark_triggered(self):
+        self._batch_mark_as_status(self._context_book_ids, self.sender().data())
+
+    def _context_book(self, book_id):
+        row = self.model.row_of(book_id)
+        if row is not None:
+            return self.model.book_at(row)
+        return self.library_controller.get_book(book_id)
 
-            completed_action = QAction("Completed", self)
-            completed_action.triggered.connect(
-                lambda: self._mark_as_status(book_id, Book.STATUS_COMPLETED)
+    def _show_context_menu(self, position, book_id):
+        if len(self.selected_book_ids) > 1 and book_id in self.selected_book_ids:
+            self._context_book_ids = list(self.selected_book_ids)
+            self._selection_count_action.setText(
+                f"{len(self._context_book_ids)} books selected"
             )
-            mark_action.addAction(completed_action)
+            self._batch_context_menu.exec(position)
+            return
 
-            menu.addMenu(mark_action)
+        self._context_book_id = book_id
 
-            menu.addSeparator()
+        book = self._context_book(book_id)
+        can_add_to_series = bool(book) and book.series_id is None
+        self._add_to_series_action.setVisible(can_add_to_series)
+        self._remove_from_series_action.setVisible(not can_add_to_series)
 
-            if self.multi_select_mode:
-                if book_id in self.selected_book_ids:
-                    select_action = QAction("Remove from Selection", self)
-                    select_action.triggered.connect(
-                        lambda: self._deselect_book(book_id)
-                    )
-                else:
-                    select_action = QAction("Add to Selection", self)
-                    select_action.triggered.connect(
-                        lambda: self._select_book(book_id, add_to_selection=True)
-                    )
-                menu.addAction(select_action)
+        self._toggle_selection_action.setVisible(self.multi_select_mode)
+        self._toggle_selection_separator.setVisible(self.multi_select_mode)
+        if book_id in self.selected_book_ids:
+            self._toggle_selection_action.setText("Remove from Selection")
+        else:
+            self._toggle_selection_action.setText("Add to Selection")
+
+        self._context_menu.exec(position)
 
-                menu.addSeparator()
+    def _toggle_context_selection(self, book_id):
+        if book_id in self.selected_book_ids:
+            self._deselect_book(book_id)
+        else:
+            self._select_book(book_id, add_to_selection=True)
 
-            remove_action = QAction("Remove from Library", self)
-            remove_action.triggered.connect(lambda: self._remove_book(book_id))
-            menu.addAction(remove_action)
+    def show_books(self, books):
+        # 取得済みの書籍一覧をそのまま表示する (非同期取得は行わない)
+        self.book_fetcher.cancel()
+        self._shown_filters = None
 
-        menu.exec(position)
+        self._clear_grid()
 
-    def _populate_grid(self, books):
-        self.all_books = books
+        self.placeholder_text = None
 
         self.calculate_grid_columns()
 
-        self.loaded_count = 0
-        self.load_more_books()
+        self.model.set_books(books, len(books))
 
-    def _select_book(self, book_id, add_to_selection=False):
-        from utils.styles import StyleSheets
+    def _update_book_row(self, book_id):
+        row = self.model.row_of(book_id)
+        if row is not None:
+            self.update(self.model.index(row))
 
-        if book_id not in self.book_widgets:
+    def _select_book(self, book_id, add_to_selection=False):
+        if self.model.row_of(book_id) is None:
             return
 
         if not add_to_selection:
             self._clear_selection()
 
-        self.selected_book_ids.add(book_id)
-        self.book_widgets[book_id].setStyleSheet(StyleSheets.GRID_ITEM_SELECTED)
-
-        widget = self.book_widgets[book_id]
-        if isinstance(widget, BookGridItemWidget) and not widget.cover_loaded:
-            QTimer.singleShot(10, widget.load_cover_image)
+        self.selected_book_ids[book_id] = None
+        self._update_book_row(book_id)
 
     def _deselect_book(self, book_id):
-        if book_id not in self.book_widgets:
-            return
-
         if book_id in self.selected_book_ids:
-            self.selected_book_ids.remove(book_id)
-            self.book_widgets[book_id].setStyleSheet("")
+            del self.selected_book_ids[book_id]
+            self._update_book_row(book_id)
 
-    def _clear_selection(self):
-        for book_id in list(self.selected_book_ids):
-            if book_id in self.book_widgets:
-                self.book_widgets[book_id].setStyleSheet("")
+    def _is_sole_selection(self, book_id):
+        # 既に単独で選択されている書籍を選び直しても再描画しない
+        return self.selected_book_id == book_id and len(self.selected_book_ids) == 1
 
+    def _clear_selection(self):
+        selected_ids = list(self.selected_book_ids)
         self.selected_book_ids.clear()
         self.selected_book_id = None
 
+        # 選択が少ないときは該当する行だけを再描画する
+        if len(selected_ids) <= self._ROW_UPDATE_LIMIT:
+            for book_id in selected_ids:
+                self._update_book_row(book_id)
+        else:
+            self.viewport().update()
+
     def toggle_multi_select_mode(self, enabled):
         self.multi_select_mode = enabled
 
@@ -822,7 +1333,7 @@ class LibraryGridView(QScrollArea):
         pass
 
     def _remove_from_series(self, book_id):
-        book = self.library_controller.get_book(book_id)
+        book = self._context_book(book_id)
         if book and book.series_id:
             self.library_controller.update_book_metadata(
                 book_id, series_id=None, series_order=None
@@ -830,22 +1341,16 @@ class LibraryGridView(QScrollArea):
             self.update_book_item(book_id)
 
     def _batch_remove_from_series(self, book_ids):
-        for book_id in book_ids:
-            book = self.library_controller.get_book(book_id)
-            if book and book.series_id:
-                self.library_controller.update_book_metadata(
-                    book_id, series_id=None, series_order=None
-                )
-                self.update_book_item(book_id)
+        self.library_controller.batch_remove_from_series(book_ids)
+        self.update_book_items(book_ids, **SERIES_CLEARED_FIELDS)
 
     def _mark_as_status(self, book_id, status):
         self.library_controller.update_book_progress(book_id, status=status)
         self.update_book_item(book_id)
 
     def _batch_mark_as_status(self, book_ids, status):
-        for book_id in book_ids:
-            self.library_controller.update_book_progress(book_id, status=status)
-            self.update_book_item(book_id)
+        self.library_controller.batch_update_status(book_ids, status)
+        self.update_book_items(book_ids, status=status)
 
     def _remove_book(self, book_id):
         pass
@@ -854,39 +1359,66 @@ class LibraryGridView(QScrollArea):
         pass
 
     def set_category_filter(self, category_id):
+        if self._filters_unchanged(category_id, self.status_filter, None):
+            return
+
         self.category_filter = category_id
         self.search_query = None
-        self.refresh()
-        QTimer.singleShot(50, self.ensure_correct_layout)
+        self.refresh(use_cache=True)
+        self.ensure_correct_layout()
 
     def search(self, query):
+        if self._filters_unchanged(self.category_filter, self.status_filter, query):
+            return
+
         self.search_query = query
-        self.refresh()
-        QTimer.singleShot(50, self.ensure_correct_layout)
+        self.refresh(use_cache=True)
+        self.ensure_correct_layout()
 
     def clear_search(self):
+        if self._filters_unchanged(self.category_filter, self.status_filter, None):
+            return
+
         self.search_query = None
-        self.refresh()
-        QTimer.singleShot(50, self.ensure_correct_layout)
+        self.refresh(use_cache=True)
+        self.ensure_correct_layout()
 
     def update_book_item(self, book_id):
-        if book_id in self.book_widgets:
-            book = self.library_controller.get_book(book_id)
+        self.reload_book_items([book_id])
+
+    def reload_book_items(self, book_ids):
+        self.book_fetcher.invalidate()
 
-            if book:
-                widget = self.book_widgets[book_id]
-                if isinstance(widget, BookGridItemWidget):
-                    widget.update_book_info(book)
+        # 表示中の書籍だけを1回のクエリで取り直し、変更通知もまとめて1回にする
+        book_ids = [
+            book_id for book_id in book_ids if self.model.row_of(book_id) is not None
+        ]
+        if book_ids:
+            self.model.replace_books(self.library_controller.get_books(book_ids))
+
+    def update_book_items(self, book_ids, **fields):
+        self.book_fetcher.invalidate()
+        self.model.update_books(book_ids, **fields)
+
+    def remove_book_item(self, book_id):
+        self.book_fetcher.invalidate()
+        self.model.remove_book(book_id)
+        self.selected_book_ids.pop(book_id, None)
+        if self.selected_book_id == book_id:
+            self.selected_book_id = None
 
     def select_book(self, book_id, emit_signal=True):
-        if book_id not in self.book_widgets:
+        row = self.model.row_of(book_id)
+        if row is None:
             return
 
         self.multi_select_mode = False
 
-        self._clear_selection()
-        self._select_book(book_id)
-        self.selected_book_id = book_id
+        if not self._is_sole_selection(book_id):
+            self._select_book(book_id)
+            self.selected_book_id = book_id
+
+        self.scrollTo(self.model.index(row))
 
         if emit_signal:
             self.book_selected.emit(book_id)
@@ -900,27 +1432,26 @@ class LibraryGridView(QScrollArea):
     def select_all(self):
         self._clear_selection()
 
-        for book_id in self.book_widgets:
-            self._select_book(book_id, add_to_selection=True)
+        self.selected_book_ids = dict.fromkeys(self.model.book_ids())
+        self.viewport().update()
 
         if self.selected_book_ids:
             self.books_selected.emit(list(self.selected_book_ids))
 
     def ensure_correct_layout(self):
-        layout_changed = self.calculate_grid_columns()
+        self._layout_timer.start()
 
-        if layout_changed and self.book_widgets:
-            settings = QSettings("YourOrg", "PDFLibraryManager")
-            settings.setValue("grid_view/preferred_columns", self.grid_columns)
+    def _do_ensure_layout(self):
+        layout_changed = self.calculate_grid_columns()
 
-            for book_id, widget in self.book_widgets.items():
-                if hasattr(widget, "update_size"):
-                    widget.update_size(self.item_width)
+        if layout_changed and self.model.rowCount():
+            if self.grid_columns != self._saved_columns:
+                settings = QSettings("YourOrg", "PDFLibraryManager")
+                settings.setValue("grid_view/preferred_columns", self.grid_columns)
+                self._saved_columns = self.grid_columns
 
             self.relayout_grid()
 
-            QTimer.singleShot(10, self.update_visible_widgets)
-
 
 class LibraryListView(QWidget):
     book_selected = pyqtSignal(int)
@@ -934,16 +1465,31 @@ class LibraryListView(QWidget):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
 
-        self.list_widget = QListWidget()
-        self.list_widget.setSelectionMode(
-            QAbstractItemView.SelectionMode.SingleSelection
+        self.model = BookListModel(cover_size=(48, 64), batch_size=30, parent=self)
+        self.model.fetch_progress.connect(self._on_fetch_progress)
+
+        self.list_view = QListView()
+        self.list_view.setModel(self.model)
+        self.list_view.setItemDelegate(BookListDelegate(self.list_view))
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        # 選択中の書籍IDは差分で更新し、クリックのたびに選択範囲を走査しない
+        self._selected_ids = {}
+        self.list_view.selectionModel().selectionChanged.connect(
+            self._on_selection_changed, Qt.ConnectionType.DirectConnection
+        )
+        self.model.modelReset.connect(self._selected_ids.clear)
+        # 送信側も受信側もGUIスレッドなので、スレッド判定を省いて直接呼び出す
+        self.list_view.clicked.connect(
+            self._on_item_clicked, Qt.ConnectionType.DirectConnection
         )
-        self.list_widget.itemClicked.connect(self._on_item_clicked)
-        self.list_widget.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        self.list_widget.customContextMenuRequested.connect(
-            self._on_context_menu_requested
+        self.list_view.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.list_view.customContextMenuRequested.connect(
+            self._on_context_menu_requested, Qt.ConnectionType.DirectConnection
         )
-        layout.addWidget(self.list_widget)
+        layout.addWidget(self.list_view)
+
+        self._build_context_menus()
 
         self.multi_select_mode = False
 
@@ -951,263 +1497,220 @@ class LibraryListView(QWidget):
         self.status_filter = None
         self.search_query = None
 
-        self.all_books = []
-        self.loaded_count = 0
-        self.batch_size = 30
-        self.is_loading = False
-
-        self.list_widget.verticalScrollBar().valueChanged.connect(
-            self.check_scroll_position
-        )
+        # 現在表示中の一覧がどのフィルタ条件で取得したものか (show_books 表示中は None)
+        self._shown_filters = None
 
-        self.loading_item = QListWidgetItem("Loading more books...")
-        self.loading_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.book_fetcher = BookFetcher(self.library_controller.db_manager, parent=self)
+        self.book_fetcher.fetched.connect(self._on_books_fetched)
 
         self.refresh()
 
-    def refresh(self):
-        self.list_widget.clear()
+    def refresh(self, use_cache=False):
+        # フィルタ切り替え以外の再読み込みはデータ変更を伴うので、キャッシュを破棄する
+        if not use_cache:
+            self.book_fetcher.invalidate()
 
-        self.loaded_count = 0
+        self._shown_filters = (
+            self.category_filter,
+            self.status_filter,
+            self.search_query,
+        )
 
-        self.list_widget.addItem("Loading books...")
+        self.model.clear()
 
-        QTimer.singleShot(50, self._load_books_async)
+        self._load_books_async()
 
     def _load_books_async(self):
-        self.all_books = self._get_filtered_books()
-
-        self.list_widget.clear()
-
-        self.load_more_books()
-
-    def load_more_books(self):
-        if self.is_loading or self.loaded_count >= len(self.all_books):
-            return
-
-        self.is_loading = True
-        try:
-            self.list_widget.takeItem(self.list_widget.count() - 1)
-        except:
-            pass
-
-        start_idx = self.loaded_count
-        end_idx = min(start_idx + self.batch_size, len(self.all_books))
-
-        for i in range(start_idx, end_idx):
-            book = self.all_books[i]
-
-            item = QListWidgetItem()
-            item.setData(Qt.ItemDataRole.UserRole, book.id)
-
-            widget = BookListItemWidget(book)
-
-            item.setSizeHint(widget.sizeHint())
-
-            self.list_widget.addItem(item)
-            self.list_widget.setItemWidget(item, widget)
-
-        if end_idx < len(self.all_books):
-            self.list_widget.addItem("Loading more books...")
-
-        self.loaded_count = end_idx
+        self.book_fetcher.fetch(
+            self.category_filter, self.status_filter, self.search_query
+        )
 
-        self.is_loading = False
+    def _on_books_fetched(self, book_data_list):
+        db_manager = self.library_controller.db_manager
+        self.model.set_books(
+            (Book(data, db_manager) for data in book_data_list), len(book_data_list)
+        )
 
-        if self.loaded_count < len(self.all_books):
+    def _on_fetch_progress(self, loaded_count, total_count):
+        if loaded_count < total_count:
             try:
                 if self.window() and hasattr(self.window(), "statusBar"):
                     self.window().statusBar.showMessage(
-                        f"Loaded {self.loaded_count} of {len(self.all_books)} books"
+                        f"Loaded {loaded_count} of {total_count} books"
                     )
             except Exception as e:
-                print(f"Error updating status bar: {e}")
-
-    def check_scroll_position(self, value):
-        scrollbar = self.list_widget.verticalScrollBar()
-        if value > scrollbar.maximum() * 0.7:
-            self.load_more_books()
+                logger.debug("Error updating status bar: %s", e)
 
-    def _populate_list(self, books):
-        self.all_books = books
+    def show_books(self, books):
+        # 取得済みの書籍一覧をそのまま表示する (非同期取得は行わない)
+        self.book_fetcher.cancel()
+        self._shown_filters = None
 
-        self.list_widget.clear()
-
-        self.loaded_count = 0
-        self.load_more_books()
-
-    def _get_filtered_books(self):
-        if self.search_query:
-            return self.library_controller.search_books(self.search_query)
-        else:
-            return self.library_controller.get_all_books(
-                category_id=self.category_filter
-            )
-
-    def _populate_list(self, books):
-        for book in books:
-            item = QListWidgetItem()
-            item.setData(Qt.ItemDataRole.UserRole, book.id)
-
-            widget = BookListItemWidget(book)
-
-            item.setSizeHint(widget.sizeHint())
-
-            self.list_widget.addItem(item)
-            self.list_widget.setItemWidget(item, widget)
+        self.model.set_books(books, len(books))
 
     def toggle_multi_select_mode(self, enabled):
         self.multi_select_mode = enabled
 
         if enabled:
-            self.list_widget.setSelectionMode(
+            self.list_view.setSelectionMode(
                 QAbstractItemView.SelectionMode.ExtendedSelection
             )
         else:
-            self.list_widget.setSelectionMode(
+            self.list_view.setSelectionMode(
                 QAbstractItemView.SelectionMode.SingleSelection
             )
 
-        self.list_widget.clearSelection()
+        self.list_view.clearSelection()
 
-    def _on_item_clicked(self, item):
-        book_id = item.data(Qt.ItemDataRole.UserRole)
+    def _on_selection_changed(self, selected, deselected):
+        for index in deselected.indexes():
+            self._selected_ids.pop(index.data(Qt.ItemDataRole.UserRole), None)
+        for index in selected.indexes():
+            self._selected_ids[index.data(Qt.ItemDataRole.UserRole)] = None
+
+    def _on_item_clicked(self, index):
+        book_id = index.data(Qt.ItemDataRole.UserRole)
 
         if self.multi_select_mode:
-            selected_items = self.list_widget.selectedItems()
-            selected_ids = [
-                item.data(Qt.ItemDataRole.UserRole) for item in selected_items
-            ]
-            self.books_selected.emit(selected_ids)
+            self.books_selected.emit(list(self._selected_ids))
         else:
             self.book_selected.emit(book_id)
 
     def _on_context_menu_requested(self, position):
-        item = self.list_widget.itemAt(position)
-        if item:
-            book_id = item.data(Qt.ItemDataRole.UserRole)
-            global_pos = self.list_widget.mapToGlobal(position)
-
-            selected_items = self.list_widget.selectedItems()
-            if len(selected_items) > 1 and item in selected_items:
-                selected_ids = [
-                    item.data(Qt.ItemDataRole.UserRole) for item in selected_items
-                ]
-                self._show_batch_context_menu(global_pos, selected_ids)
+        index = self.list_view.indexAt(position)
+        if index.isValid():
+            book_id = index.data(Qt.ItemDataRole.UserRole)
+            global_pos = self.list_view.viewport().mapToGlobal(position)
+
+            if len(self._selected_ids) > 1 and book_id in self._selected_ids:
+                self._show_batch_context_menu(global_pos, list(self._selected_ids))
             else:
                 self._show_context_menu(global_pos, book_id)
 
-    def _show_context_menu(self, position, book_id):
-        menu = QMenu()
+    def _build_context_menus(self):
+        # メニューは一度だけ構築し、表示時に対象の書籍IDだけを差し替える
+        self._context_book_id = None
+        self._context_book_ids = []
+
+        self._context_menu = QMenu(self)
 
         open_action = QAction("Open", self)
-        open_action.triggered.connect(lambda: self.book_selected.emit(book_id))
-        menu.addAction(open_action)
+        open_action.triggered.connect(
+            lambda: self.book_selected.emit(self._context_book_id)
+        )
+        self._context_menu.addAction(open_action)
 
-        menu.addSeparator()
+        self._context_menu.addSeparator()
 
         edit_action = QAction("Edit Metadata", self)
-        edit_action.triggered.connect(lambda: self._edit_metadata(book_id))
-        menu.addAction(edit_action)
-
-        book = self.library_controller.get_book(book_id)
-        if book and book.series_id is None:
-            add_to_series_action = QAction("Add to Series", self)
-            add_to_series_action.triggered.connect(lambda: self._add_to_series(book_id))
-            menu.addAction(add_to_series_action)
-        else:
-            remove_from_series_action = QAction("Remove from Series", self)
-            remove_from_series_action.triggered.connect(
-                lambda: self._remove_from_series(book_id)
-            )
-            menu.addAction(remove_from_series_action)
-
-        menu.addSeparator()
-
-        mark_action = QMenu("Mark as", menu)
-
-        unread_action = QAction("Unread", self)
-        unread_action.triggered.connect(
-            lambda: self._mark_as_status(book_id, Book.STATUS_UNREAD)
+        edit_action.triggered.connect(
+            lambda: self._edit_metadata(self._context_book_id)
         )
-        mark_action.addAction(unread_action)
+        self._context_menu.addAction(edit_action)
 
-        reading_action = QAction("Reading", self)
-        reading_action.triggered.connect(
-            lambda: self._mark_as_status(book_id, Book.STATUS_READING)
+        self._add_to_series_action = QAction("Add to Series", self)
+        self._add_to_series_action.triggered.connect(
+            lambda: self._add_to_series(self._context_book_id)
         )
-        mark_action.addAction(reading_action)
+        self._context_menu.addAction(self._add_to_series_action)
 
-        completed_action = QAction("Completed", self)
-        completed_action.triggered.connect(
-            lambda: self._mark_as_status(book_id, Book.STATUS_COMPLETED)
+        self._remove_from_series_action = QAction("Remove from Series", self)
+        self._remove_from_series_action.triggered.connect(
+            lambda: self._remove_from_series(self._context_book_id)
         )
-        mark_action.addAction(completed_action)
+        self._context_menu.addAction(self._remove_from_series_action)
 
-        menu.addMenu(mark_action)
+        self._context_menu.addSeparator()
 
-        menu.addSeparator()
+        mark_action = QMenu("Mark as", self._context_menu)
 
-        remove_action = QAction("Remove from Library", self)
-        remove_action.triggered.connect(lambda: self._remove_book(book_id))
-        menu.addAction(remove_action)
+        for status, text in MARK_AS_STATUSES:
+            action = QAction(text, self)
+            action.setData(status)
+            action.triggered.connect(self._on_mark_triggered)
+            mark_action.addAction(action)
 
-        menu.exec(position)
+        self._context_menu.addMenu(mark_action)
 
-    def _show_batch_context_menu(self, position, book_ids):
-        menu = QMenu()
+        self._context_menu.addSeparator()
+
+        remove_action = QAction("Remove from Library", self)
+        remove_action.triggered.connect(
+            lambda: self._remove_book(self._context_book_id)
+        )
+        self._context_menu.addAction(remove_action)
+
+        self._batch_context_menu = QMenu(self)
 
-        selection_count = len(book_ids)
-        menu.addAction(f"{selection_count} books selected")
-        menu.addSeparator()
+        self._selection_count_action = self._batch_context_menu.addAction("")
+        self._batch_context_menu.addSeparator()
 
         edit_action = QAction("Edit Selected Books", self)
-        edit_action.triggered.connect(lambda: self._batch_edit_metadata(book_ids))
-        menu.addAction(edit_action)
+        edit_action.triggered.connect(
+            lambda: self._batch_edit_metadata(self._context_book_ids)
+        )
+        self._batch_context_menu.addAction(edit_action)
 
         add_to_series_action = QAction("Add Selected to Series", self)
         add_to_series_action.triggered.connect(
-            lambda: self._batch_add_to_series(book_ids)
+            lambda: self._batch_add_to_series(self._context_book_ids)
         )
-        menu.addAction(add_to_series_action)
+        self._batch_context_menu.addAction(add_to_series_action)
 
         remove_from_series_action = QAction("Remove Selected from Series", self)
         remove_from_series_action.triggered.connect(
-            lambda: self._batch_remove_from_series(book_ids)
+            lambda: self._batch_remove_from_series(self._context_book_ids)
         )
-        menu.addAction(remove_from_series_action)
+        self._batch_context_menu.addAction(remove_from_series_action)
 
-        menu.addSeparator()
+        self._batch_context_menu.addSeparator()
 
-        mark_action = QMenu("Mark Selected as", menu)
+        mark_action = QMenu("Mark Selected as", self._batch_context_menu)
 
-        unread_action = QAction("Unread", self)
-        unread_action.triggered.connect(
-            lambda: self._batch_mark_as_status(book_ids, Book.STATUS_UNREAD)
-        )
-        mark_action.addAction(unread_action)
+        for status, text in MARK_AS_STATUSES:
+            action = QAction(text, self)
+            action.setData(status)
+            action.triggered.connect(self._on_batch_mark_triggered)
+            mark_action.addAction(action)
 
-        reading_action = QAction("Reading", self)
-        reading_action.triggered.connect(
-            lambda: self._batch_mark_as_status(book_ids, Book.STATUS_READING)
-        )
-        mark_action.addAction(reading_action)
+        self._batch_context_menu.addMenu(mark_action)
 
-        completed_action = QAction("Completed", self)
-        completed_action.triggered.connect(
-            lambda: self._batch_mark_as_status(book_ids, Book.STATUS_COMPLETED)
+        self._batch_context_menu.addSeparator()
+
+        remove_action = QAction("Remove Selected from Library", self)
+        remove_action.triggered.connect(
+            lambda: self._batch_remove_books(self._context_book_ids)
         )
-        mark_action.addAction(completed_action)
+        self._batch_context_menu.addAction(remove_action)
 
-        menu.addMenu(mark_action)
+    def _on_mark_triggered(self):
+        self._mark_as_status(self._context_book_id, self.sender().data())
 
-        menu.addSeparator()
+    def _on_batch_mark_triggered(self):
+        self._batch_mark_as_status(self._context_book_ids, self.sender().data())
 
-        remove_action = QAction("Remove Selected from Library", self)
-        remove_action.triggered.connect(lambda: self._batch_remove_books(book_ids))
-        menu.addAction(remove_action)
+    def _context_book(self, book_id):
+        row = self.model.row_of(book_id)
+        if row is not None:
+            return self.model.book_at(row)
+        return self.library_controller.get_book(book_id)
+
+    def _show_context_menu(self, position, book_id):
+        self._context_book_id = book_id
+
+        book = self._context_book(book_id)
+        can_add_to_series = bool(book) and book.series_id is None
+        self._add_to_series_action.setVisible(can_add_to_series)
+        self._remove_from_series_action.setVisible(not can_add_to_series)
+
+        self._context_menu.exec(position)
+
+    def _show_batch_context_menu(self, position, book_ids):
+        self._context_book_ids = book_ids
 
-        menu.exec(position)
+        self._selection_count_action.setText(f"{len(book_ids)} books selected")
+
+        self._batch_context_menu.exec(position)
 
     def _edit_metadata(self, book_id):
         pass
@@ -1228,22 +1731,16 @@ class LibraryListView(QWidget):
         self.update_book_item(book_id)
 
     def _batch_remove_from_series(self, book_ids):
-        for book_id in book_ids:
-            book = self.library_controller.get_book(book_id)
-            if book and book.series_id:
-                self.library_controller.update_book_metadata(
-                    book_id, series_id=None, series_order=None
-                )
-                self.update_book_item(book_id)
+        self.library_controller.batch_remove_from_series(book_ids)
+        self.update_book_items(book_ids, **SERIES_CLEARED_FIELDS)
 
     def _mark_as_status(self, book_id, status):
         self.library_controller.update_book_progress(book_id, status=status)
         self.update_book_item(book_id)
 
     def _batch_mark_as_status(self, book_ids, status):
-        for book_id in book_ids:
-            self.library_controller.update_book_progress(book_id, status=status)
-            self.update_book_item(book_id)
+        self.library_controller.batch_update_status(book_ids, status)
+        self.update_book_items(book_ids, status=status)
 
     def _remove_book(self, book_id):
         pass
@@ -1252,71 +1749,102 @@ class LibraryListView(QWidget):
         pass
 
     def set_category_filter(self, category_id):
+        if self._filters_unchanged(category_id, self.status_filter, None):
+            return
+
         self.category_filter = category_id
         self.search_query = None
-        self.refresh()
+        self.refresh(use_cache=True)
 
     def search(self, query):
+        if self._filters_unchanged(self.category_filter, self.status_filter, query):
+            return
+
         self.search_query = query
-        self.refresh()
+        self.refresh(use_cache=True)
 
     def clear_search(self):
+        if self._filters_unchanged(self.category_filter, self.status_filter, None):
+            return
+
         self.search_query = None
-        self.refresh()
+        self.refresh(use_cache=True)
 
     def update_book_item(self, book_id):
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            if item.data(Qt.ItemDataRole.UserRole) == book_id:
-                book = self.library_controller.get_book(book_id)
-                if book:
-                    widget = self.list_widget.itemWidget(item)
-                    if isinstance(widget, BookListItemWidget):
-                        widget.update_book_info(book)
-                break
+        self.reload_book_items([book_id])
+
+    def reload_book_items(self, book_ids):
+        self.book_fetcher.invalidate()
+
+        # 表示中の書籍だけを1回のクエリで取り直し、変更通知もまとめて1回にする
+        book_ids = [
+            book_id for book_id in book_ids if self.model.row_of(book_id) is not None
+        ]
+        if book_ids:
+            self.model.replace_books(self.library_controller.get_books(book_ids))
+
+    def update_book_items(self, book_ids, **fields):
+        self.book_fetcher.invalidate()
+        self.model.update_books(book_ids, **fields)
+
+    def remove_book_item(self, book_id):
+        self.book_fetcher.invalidate()
+        self.model.remove_book(book_id)
+        self._selected_ids.pop(book_id, None)
 
     def select_book(self, book_id, emit_signal=True):
         self.toggle_multi_select_mode(False)
 
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            if item.data(Qt.ItemDataRole.UserRole) == book_id:
-                self.list_widget.setCurrentItem(item)
+        row = self.model.row_of(book_id)
+        if row is None:
+            return
+
+        self.list_view.setCurrentIndex(self.model.index(row))
+
+        if emit_signal:
+            self.book_selected.emit(book_id)
 
-                if emit_signal:
-                    self.book_selected.emit(book_id)
-                break
+    def set_selected_book_ids(self, book_ids):
+        selection_model = self.list_view.selectionModel()
+        selection_model.clearSelection()
+
+        for book_id in book_ids:
+            row = self.model.row_of(book_id)
+            if row is not None:
+                selection_model.select(
+                    self.model.index(row),
+                    QItemSelectionModel.SelectionFlag.Select,
+                )
+
+    def clear_selection(self):
+        self.list_view.clearSelection()
 
     def get_selected_book_id(self):
-        current_item = self.list_widget.currentItem()
-        if current_item:
-            return current_item.data(Qt.ItemDataRole.UserRole)
+        current_index = self.list_view.currentIndex()
+        if current_index.isValid():
+            return current_index.data(Qt.ItemDataRole.UserRole)
         return None
 
     def get_selected_book_ids(self):
-        selected_items = self.list_widget.selectedItems()
-        return [item.data(Qt.ItemDataRole.UserRole) for item in selected_items]
+        return list(self._selected_ids)
 
     def select_all(self):
         self.toggle_multi_select_mode(True)
 
-        self.list_widget.selectAll()
+        self.list_view.selectAll()
 
         selected_ids = self.get_selected_book_ids()
         if selected_ids:
             self.books_selected.emit(selected_ids)
 
-    def _get_filtered_books(self):
-        if self.search_query:
-            base_books = self.library_controller.search_books(self.search_query)
-        else:
-            base_books = self.library_controller.get_all_books(
-                category_id=self.category_filter, status=self.status_filter
-            )
-
-        return base_books
-
     def set_status_filter(self, status):
+        if self._filters_unchanged(self.category_filter, status, None):
+            return
+
         self.status_filter = status
         self.search_query = None  # 検索クエリをクリア
-        self.refresh()
+        self.refresh(use_cache=True)
+
+    def _filters_unchanged(self, category_id, status, search_query):
+        # 同じ条件での再選択は一覧を作り直さない (条件が変わったときは丸ごと作り直す)
+        return self._shown_filters == (category_id, status, search_query)
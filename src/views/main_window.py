@@ -5,7 +5,7 @@ from PyQt6.QtCore import (
     QTimer,
     pyqtSignal,
 )
-from PyQt6.QtGui import QAction, QKeySequence
+from PyQt6.QtGui import QAction, QActionGroup, QKeySequence
 from PyQt6.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -35,10 +35,16 @@ from models.book import Book
 from models.database import DatabaseManager
 from views.dialogs.import_dialog import ImportDialog
 from views.dialogs.settings_dialog import SettingsDialog
-from views.library_view import LibraryGridView, LibraryListView
+from views.library_view import (
+    MARK_AS_STATUSES,
+    SERIES_CLEARED_FIELDS,
+    LibraryGridView,
+    LibraryListView,
+)
 from views.metadata_editor import MetadataEditor
 from views.reader_view import PDFReaderView
 from views.series_view import (
+    SeriesFetchWorker,
     SeriesGridView,
     SeriesListView,
 )
@@ -57,9 +63,11 @@ class MainWindow(QMainWindow):
         self.db_manager = DatabaseManager(db_path)
         self.library_controller = LibraryController(self.db_manager)
 
+        # カテゴリ一覧は追加・削除があるまで使い回す (invalidate_categories で破棄)
+        self._categories_cache = None
+
         self.setWindowTitle("PDF Library Manager")
         self.setMinimumSize(400, 400)
-        self.resize(1600, 900)
 
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
@@ -85,12 +93,19 @@ class MainWindow(QMainWindow):
         self.main_splitter.addWidget(self.reader_panel)
 
         self.main_splitter.setSizes([550, 700])
-        QTimer.singleShot(100, self.set_optimal_splitter_sizes)
 
         self.main_splitter.setStretchFactor(0, 0)
         self.main_splitter.setStretchFactor(1, 1)
 
-        self.main_splitter.splitterMoved.connect(self.on_splitter_moved)
+        # ドラッグ中は1ピクセルごとに通知されるので、止まってから1回だけ反映する
+        # (分割位置の保存は closeEvent で行う)
+        self._splitter_timer = QTimer(self)
+        self._splitter_timer.setSingleShot(True)
+        self._splitter_timer.setInterval(150)
+        self._splitter_timer.timeout.connect(self.on_splitter_moved)
+        self.main_splitter.splitterMoved.connect(
+            lambda pos, index: self._splitter_timer.start()
+        )
 
         self.left_panel_width = 550
 
@@ -123,33 +138,22 @@ class MainWindow(QMainWindow):
         self.current_series_id = None
         self.in_series_filtered_mode = False
 
-        QTimer.singleShot(50, self.async_initialize_data)
+        self._series_worker = None
+
+        QTimer.singleShot(0, self.async_initialize_data)
 
         self.restore_window_state()
 
-        self.configure_window_for_display()
+        # ウィンドウサイズは保存済みジオメトリか画面サイズからの既定値のどちらか一方で決め、
+        # resize を重ねてグリッドの再計算が何度も走らないようにする
+        if not self._has_saved_geometry:
+            self.configure_window_for_display()
 
         self.load_grid_view_settings()
 
         self.default_sort_by = "title"
         self.default_sort_order = "asc"
 
-        QTimer.singleShot(100, self.apply_window_settings)
-
-    def apply_window_settings(self):
-        settings = QSettings("YourOrg", "PDFLibraryManager")
-
-        size = settings.value("window/size")
-        if size:
-            try:
-                if isinstance(size, str):
-                    width, height = map(int, size.strip("()").split(","))
-                    self.resize(width, height)
-                else:
-                    self.resize(size)
-            except (ValueError, TypeError):
-                pass
-
     def configure_window_for_display(self):
         screen = QApplication.primaryScreen().availableGeometry()
 
@@ -168,10 +172,10 @@ class MainWindow(QMainWindow):
         preferred_columns = settings.value("grid_view/preferred_columns", 5, int)
         self.grid_view.ideal_columns = preferred_columns
 
-        QTimer.singleShot(200, self.adjust_layouts_after_show)
-
     def adjust_layouts_after_show(self):
-        self.set_optimal_splitter_sizes()
+        # 保存済みの分割位置を復元した場合は、既定の比率で上書きしない
+        if not getattr(self, "user_adjusted_splitter", False):
+            self.set_optimal_splitter_sizes()
 
         self.grid_view.calculate_grid_columns()
         self.grid_view.relayout_grid()
@@ -184,7 +188,6 @@ class MainWindow(QMainWindow):
             self.splash.showMessage(
                 message, Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignHCenter
             )
-            QApplication.processEvents()
 
     def set_optimal_splitter_sizes(self):
         total_width = self.width()
@@ -194,33 +197,80 @@ class MainWindow(QMainWindow):
         self.left_panel_width = left_panel_width
 
     def async_initialize_data(self):
-        self._update_splash("書籍データを読み込み中...")
-        QTimer.singleShot(0, self.load_books_async)
+        # 読み込みはどれもバックグラウンドで行われるので、全部の結果が届いてから
+        # 完了処理とレイアウト調整をまとめて1回だけ行う
+        self._pending_loads = {"grid_books", "list_books", "series"}
+
+        self.grid_view.book_fetcher.fetched.connect(
+            lambda _: self._on_startup_load_done("grid_books")
+        )
+        self.list_view.book_fetcher.fetched.connect(
+            lambda _: self._on_startup_load_done("list_books")
+        )
+        # 取得に失敗した場合も、起動処理が止まらないようにする
+        self.grid_view.book_fetcher.failed.connect(
+            lambda: self._on_startup_load_done("grid_books")
+        )
+        self.list_view.book_fetcher.failed.connect(
+            lambda: self._on_startup_load_done("list_books")
+        )
+
+        self.load_books_async()
+        self.load_series_async()
+
+    def _on_startup_load_done(self, name):
+        if not self.loading or name not in self._pending_loads:
+            return
+
+        self._pending_loads.discard(name)
+        if self._pending_loads:
+            return
+
+        self.finish_loading()
+        self.adjust_layouts_after_show()
+        self.initial_layout_adjustment()
 
     def load_books_async(self):
         self.statusBar.showMessage("書籍データを読み込み中...")
+        self._update_splash("書籍データを読み込み中...")
         self.grid_view.refresh()
         self.list_view.refresh()
 
-        QTimer.singleShot(100, self.load_series_async)
-
     def load_series_async(self):
         self.statusBar.showMessage("シリーズデータを読み込み中...")
         self._update_splash("シリーズデータを読み込み中...")
 
-        self.all_series = self.library_controller.get_all_series()
-        self.series_grid_view.refresh()
-        self.series_list_view.refresh()
+        # シリーズはワーカースレッドで取得し、ビューへの反映は受け取ったUIスレッドで行う
+        self._series_worker = SeriesFetchWorker(self.db_manager.db_path, parent=self)
+        self._series_worker.fetched.connect(
+            self._on_series_loaded, Qt.ConnectionType.QueuedConnection
+        )
+        self._series_worker.finished.connect(self._on_series_worker_finished)
+        self._series_worker.start()
+
+    def _on_series_worker_finished(self):
+        worker = self.sender()
+        if worker is self._series_worker:
+            self._series_worker = None
+        worker.deleteLater()
+
+        # 取得に失敗して fetched が来なかった場合も、起動処理が止まらないようにする
+        self._on_startup_load_done("series")
+
+    def _on_series_loaded(self, series_data_list, books_by_series):
+        self.all_series = self.library_controller.build_series(
+            series_data_list, books_by_series
+        )
+        self.series_grid_view.set_series(self.all_series)
+        self.series_list_view.set_series(self.all_series)
 
-        QTimer.singleShot(100, self.finish_loading)
+        self._on_startup_load_done("series")
 
     def finish_loading(self):
         self.loading = False
         self.progress_bar.setVisible(False)
         self.statusBar.showMessage("ライブラリの読み込みが完了しました", 3000)
 
-        QTimer.singleShot(100, self.initial_layout_adjustment)
-
     def initial_layout_adjustment(self):
         self.grid_view.ensure_correct_layout()
         self.series_grid_view.ensure_correct_layout()
@@ -275,23 +325,11 @@ class MainWindow(QMainWindow):
 
         self.batch_status_menu = QMenu("Mark as", self)
 
-        self.batch_mark_unread_action = QAction("Unread", self)
-        self.batch_mark_unread_action.triggered.connect(
-            lambda: self.batch_mark_as_status(Book.STATUS_UNREAD)
-        )
-        self.batch_status_menu.addAction(self.batch_mark_unread_action)
-
-        self.batch_mark_reading_action = QAction("Reading", self)
-        self.batch_mark_reading_action.triggered.connect(
-            lambda: self.batch_mark_as_status(Book.STATUS_READING)
-        )
-        self.batch_status_menu.addAction(self.batch_mark_reading_action)
-
-        self.batch_mark_completed_action = QAction("Completed", self)
-        self.batch_mark_completed_action.triggered.connect(
-            lambda: self.batch_mark_as_status(Book.STATUS_COMPLETED)
-        )
-        self.batch_status_menu.addAction(self.batch_mark_completed_action)
+        for status, text in MARK_AS_STATUSES:
+            action = QAction(text, self)
+            action.setData(status)
+            action.triggered.connect(self._on_batch_mark_triggered)
+            self.batch_status_menu.addAction(action)
 
         self.batch_actions_menu.addMenu(self.batch_status_menu)
 
@@ -320,7 +358,6 @@ class MainWindow(QMainWindow):
         self.toolbar.addWidget(self.category_label)
 
         self.category_combo = QComboBox()
-        self.category_combo.addItem("All Categories")
         self.populate_category_combo()
         self.category_combo.currentIndexChanged.connect(self.filter_by_category)
         self.toolbar.addWidget(self.category_combo)
@@ -476,12 +513,17 @@ class MainWindow(QMainWindow):
 
         view_menu = self.menuBar().addMenu("&View")
 
+        # グリッド/リストは排他なので、チェックの付け替えはアクショングループに任せる
+        view_type_group = QActionGroup(self)
+        view_type_group.setExclusive(True)
+
         grid_view_action = QAction("&Grid View", self)
         grid_view_action.setCheckable(True)
         grid_view_action.setChecked(True)
         grid_view_action.triggered.connect(
             lambda: self.view_type_combo.setCurrentIndex(0)
         )
+        view_type_group.addAction(grid_view_action)
         view_menu.addAction(grid_view_action)
         self.grid_view_action = grid_view_action
 
@@ -490,6 +532,7 @@ class MainWindow(QMainWindow):
         list_view_action.triggered.connect(
             lambda: self.view_type_combo.setCurrentIndex(1)
         )
+        view_type_group.addAction(list_view_action)
         view_menu.addAction(list_view_action)
         self.list_view_action = list_view_action
 
@@ -616,13 +659,34 @@ class MainWindow(QMainWindow):
         self.library_tabs.currentChanged.connect(self.on_library_tab_changed)
         self.main_tabs.currentChanged.connect(self.on_main_tab_changed)
 
+    def invalidate_categories(self):
+        self._categories_cache = None
+
     def populate_category_combo(self):
-        self.category_combo.clear()
-        self.category_combo.addItem("All Categories", None)
+        if self._categories_cache is None:
+            self._categories_cache = self.db_manager.get_all_categories()
 
-        categories = self.db_manager.get_all_categories()
-        for category in categories:
-            self.category_combo.addItem(category["name"], category["id"])
+        current_category_id = self.category_combo.currentData()
+
+        # 作り直しの途中で currentIndexChanged が飛び、全ビューが再読み込みされないようにする
+        self.category_combo.blockSignals(True)
+        try:
+            self.category_combo.clear()
+            self.category_combo.addItem("All Categories", None)
+
+            for category in self._categories_cache:
+                self.category_combo.addItem(category["name"], category["id"])
+
+            index = 0
+            if current_category_id is not None:
+                index = self.category_combo.findData(current_category_id)
+            self.category_combo.setCurrentIndex(max(index, 0))
+        finally:
+            self.category_combo.blockSignals(False)
+
+        # 選択中のカテゴリが削除された場合だけ、絞り込みを解除する
+        if index < 0:
+            self.filter_by_category(0)
 
     def change_view_type(self, index):
         current_main_tab = self.main_tabs.currentWidget()
@@ -630,11 +694,11 @@ class MainWindow(QMainWindow):
         if current_main_tab == self.books_tab:
             self.library_tabs.setCurrentIndex(index)
 
-            self.grid_view_action.setChecked(index == 0)
-            self.list_view_action.setChecked(index == 1)
+            self._check_view_type_action(index)
 
+            # ensure_correct_layout は内部のタイマーで連続した要求をまとめる
             if index == 0:
-                QTimer.singleShot(100, self.grid_view.ensure_correct_layout)
+                self.grid_view.ensure_correct_layout()
 
             if self.current_series_id and self.back_to_series_button.isVisible():
                 self.filter_by_series(self.current_series_id)
@@ -643,10 +707,12 @@ class MainWindow(QMainWindow):
             self.series_tabs.setCurrentIndex(index)
 
             if index == 0:
-                QTimer.singleShot(100, self.series_grid_view.ensure_correct_layout)
+                self.series_grid_view.ensure_correct_layout()
 
-        if index == 0:  # Grid View
-            QTimer.singleShot(50, lambda: self.grid_view.ensure_correct_layout())
+    def _check_view_type_action(self, index):
+        action = self.grid_view_action if index == 0 else self.list_view_action
+        if not action.isChecked():
+            action.setChecked(True)
 
     def filter_by_category(self, index):
         category_id = self.category_combo.itemData(index)
@@ -833,22 +899,11 @@ class MainWindow(QMainWindow):
             success = self.library_controller.remove_book(book_id, delete_file=False)
 
             if success:
-                if book_id in self.grid_view.book_widgets:
-                    widget = self.grid_view.book_widgets[book_id]
-                    widget.setParent(None)
-                    widget.deleteLater()
-                    del self.grid_view.book_widgets[book_id]
-
-                for i in range(self.list_view.list_widget.count()):
-                    item = self.list_view.list_widget.item(i)
-                    if item and item.data(Qt.ItemDataRole.UserRole) == book_id:
-                        self.list_view.list_widget.takeItem(i)
-                        break
-
-                if self.grid_view.selected_book_id == book_id:
-                    self.grid_view.selected_book_id = None
+                self.grid_view.remove_book_item(book_id)
+                self.list_view.remove_book_item(book_id)
+
                 if self.list_view.get_selected_book_id() == book_id:
-                    self.list_view.list_widget.clearSelection()
+                    self.list_view.clear_selection()
 
                 self.statusBar.showMessage(f"Book '{book.title}' removed from library")
 
@@ -883,6 +938,14 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event):
         self.save_window_state()
 
+        # 実行中のスレッドを残したまま破棄すると異常終了するため、終わるまで待つ
+        if self._series_worker is not None:
+            self._series_worker.fetched.disconnect(self._on_series_loaded)
+            self._series_worker.wait()
+
+        self.grid_view.book_fetcher.shutdown()
+        self.list_view.book_fetcher.shutdown()
+
         self.reader_view.close_current_book()
         self.db_manager.close()
         event.accept()
@@ -925,12 +988,7 @@ class MainWindow(QMainWindow):
     def sync_selection_to_list_view(self, book_ids):
         self.list_view.toggle_multi_select_mode(True)
 
-        self.list_view.list_widget.clearSelection()
-
-        for i in range(self.list_view.list_widget.count()):
-            item = self.list_view.list_widget.item(i)
-            if item.data(Qt.ItemDataRole.UserRole) in book_ids:
-                item.setSelected(True)
+        self.list_view.set_selected_book_ids(book_ids)
 
     def sync_selection_to_grid_view(self, book_ids):
         self.grid_view.toggle_multi_select_mode(True)
@@ -977,9 +1035,8 @@ class MainWindow(QMainWindow):
 
             dialog = BatchMetadataEditor(self.library_controller, book_ids, self)
             if dialog.exec():
-                for book_id in book_ids:
-                    self.grid_view.update_book_item(book_id)
-                    self.list_view.update_book_item(book_id)
+                self.grid_view.reload_book_items(book_ids)
+                self.list_view.reload_book_items(book_ids)
 
                 self.statusBar.showMessage(
                     f"Updated metadata for {len(book_ids)} books"
@@ -1081,19 +1138,12 @@ class MainWindow(QMainWindow):
                 order_method = order_method_combo.currentData()
 
                 if order_method == "none":
-                    for book_id in book_ids:
-                        self.library_controller.update_book_metadata(
-                            book_id, series_id=series_id
-                        )
+                    self.library_controller.batch_add_to_series(book_ids, series_id)
                 else:
                     start_order = start_order_spin.value()
                     preserve_current = preserve_current_check.isChecked()
 
-                    books = [
-                        self.library_controller.get_book(book_id)
-                        for book_id in book_ids
-                    ]
-                    books = [book for book in books if book]
+                    books = self.library_controller.get_books(book_ids)
 
                     import re
 
@@ -1135,31 +1185,38 @@ class MainWindow(QMainWindow):
                     else:
                         books.sort(key=natural_sort_key)
 
-                    current_order = start_order
-                    for book in books:
-                        self.library_controller.update_book_metadata(
-                            book.id, series_id=series_id, series_order=current_order
-                        )
-                        current_order += 1
+                    self.library_controller.batch_add_to_series(
+                        [book.id for book in books], series_id, start_order
+                    )
 
-                for book_id in book_ids:
-                    self.grid_view.update_book_item(book_id)
-                    self.list_view.update_book_item(book_id)
+                self.grid_view.reload_book_items(book_ids)
+                self.list_view.reload_book_items(book_ids)
 
                 self.statusBar.showMessage(f"Added {len(book_ids)} books to series")
 
     def batch_remove_from_series(self, book_ids=None):
+        current_view = self.library_tabs.currentWidget()
+        if current_view != self.grid_view:
+            current_view = self.list_view
+
         if book_ids is None:
-            current_view = self.library_tabs.currentWidget()
-            if current_view == self.grid_view:
-                book_ids = self.grid_view.get_selected_book_ids()
-            else:
-                book_ids = self.list_view.get_selected_book_ids()
+            book_ids = current_view.get_selected_book_ids()
 
         if not book_ids:
             QMessageBox.warning(self, "Warning", "No books selected.")
             return
 
+        # 表示中の書籍はシリーズに属していないものを除外する (DBは読まない)
+        loaded = {book.id: book for book in current_view.model.find_books(book_ids)}
+        book_ids = [
+            book_id
+            for book_id in book_ids
+            if book_id not in loaded or loaded[book_id].series_id
+        ]
+        if not book_ids:
+            self.statusBar.showMessage("Selected books are not in a series")
+            return
+
         result = QMessageBox.question(
             self,
             "Confirm Remove from Series",
@@ -1171,17 +1228,16 @@ class MainWindow(QMainWindow):
         if result != QMessageBox.StandardButton.Yes:
             return
 
-        for book_id in book_ids:
-            self.library_controller.update_book_metadata(
-                book_id, series_id=None, series_order=None
-            )
+        self.library_controller.batch_remove_from_series(book_ids)
 
-        for book_id in book_ids:
-            self.grid_view.update_book_item(book_id)
-            self.list_view.update_book_item(book_id)
+        self.grid_view.update_book_items(book_ids, **SERIES_CLEARED_FIELDS)
+        self.list_view.update_book_items(book_ids, **SERIES_CLEARED_FIELDS)
 
         self.statusBar.showMessage(f"Removed {len(book_ids)} books from series")
 
+    def _on_batch_mark_triggered(self):
+        self.batch_mark_as_status(self.sender().data())
+
     def batch_mark_as_status(self, status, book_ids=None):
         if book_ids is None:
             current_view = self.library_tabs.currentWidget()
@@ -1194,18 +1250,12 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Warning", "No books selected.")
             return
 
-        status_display = {
-            "unread": "Unread",
-            "reading": "Reading",
-            "completed": "Completed",
-        }.get(status, status)
+        status_display = Book.STATUS_NAMES.get(status, status)
 
-        for book_id in book_ids:
-            self.library_controller.update_book_progress(book_id, status=status)
+        self.library_controller.batch_update_status(book_ids, status)
 
-        for book_id in book_ids:
-            self.grid_view.update_book_item(book_id)
-            self.list_view.update_book_item(book_id)
+        self.grid_view.update_book_items(book_ids, status=status)
+        self.list_view.update_book_items(book_ids, status=status)
 
         self.statusBar.showMessage(f"Marked {len(book_ids)} books as {status_display}")
 
@@ -1242,23 +1292,8 @@ class MainWindow(QMainWindow):
 
         if result["success"]:
             for book_id in result["success"]:
-                if book_id in self.grid_view.book_widgets:
-                    widget = self.grid_view.book_widgets[book_id]
-                    widget.setParent(None)
-                    widget.deleteLater()
-                    del self.grid_view.book_widgets[book_id]
-
-                    if book_id in self.grid_view.selected_book_ids:
-                        self.grid_view.selected_book_ids.remove(book_id)
-                    if self.grid_view.selected_book_id == book_id:
-                        self.grid_view.selected_book_id = None
-
-            for book_id in result["success"]:
-                for i in range(self.list_view.list_widget.count()):
-                    item = self.list_view.list_widget.item(i)
-                    if item and item.data(Qt.ItemDataRole.UserRole) == book_id:
-                        self.list_view.list_widget.takeItem(i)
-                        break
+                self.grid_view.remove_book_item(book_id)
+                self.list_view.remove_book_item(book_id)
 
         if result["failed"]:
             QMessageBox.warning(
@@ -1313,11 +1348,9 @@ class MainWindow(QMainWindow):
 
         current_view = self.library_tabs.currentWidget()
         if current_view == self.grid_view:
-            self.grid_view._clear_grid()
-            self.grid_view._populate_grid(books)
+            self.grid_view.show_books(books)
         else:
-            self.list_view.list_widget.clear()
-            self.list_view._populate_list(books)
+            self.list_view.show_books(books)
         QTimer.singleShot(100, self.ensure_correct_layout)
 
     def clear_series_filter(self):
@@ -1327,12 +1360,9 @@ class MainWindow(QMainWindow):
     def update_series_view_state(self):
         current_series_view = self.series_tabs.currentWidget()
 
-        if current_series_view == self.series_grid_view:
-            self.grid_view_action.setChecked(True)
-            self.list_view_action.setChecked(False)
-        else:
-            self.grid_view_action.setChecked(False)
-            self.list_view_action.setChecked(True)
+        self._check_view_type_action(
+            0 if current_series_view == self.series_grid_view else 1
+        )
 
     def show_series_editor(self, series_id=None):
         if series_id is None:
@@ -1350,6 +1380,8 @@ class MainWindow(QMainWindow):
                     self.series_grid_view.update_series_item(series_id)
                     self.series_list_view.update_series_item(series_id)
 
+                    # 編集画面から新しいカテゴリが作られている場合がある
+                    self.invalidate_categories()
                     self.refresh_library()
 
                     self.statusBar.showMessage("Series updated successfully")
@@ -1459,11 +1491,9 @@ class MainWindow(QMainWindow):
         current_view = self.library_tabs.currentWidget()
 
         if current_view == self.grid_view:
-            self.grid_view._clear_grid()
-            self.grid_view._populate_grid(books)
+            self.grid_view.show_books(books)
         elif current_view == self.list_view:
-            self.list_view.list_widget.clear()
-            self.list_view._populate_list(books)
+            self.list_view.show_books(books)
 
     def refresh_books_view(self):
         if self.in_series_filtered_mode and self.current_series_id:
@@ -1489,8 +1519,15 @@ class MainWindow(QMainWindow):
             dialog = CategoryManager(self.library_controller, self)
             dialog.exec()
 
+            self.invalidate_categories()
             self.populate_category_combo()
 
+            # 書籍・シリーズの行はカテゴリ名をJOINして持っているので、キャッシュを使わず取り直す
+            self.series_books_cache = {}
+            self.refresh_books_view()
+            self.series_grid_view.refresh()
+            self.series_list_view.refresh()
+
             self.update_category_filter_status()
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to open category manager: {e}")
@@ -1515,8 +1552,8 @@ class MainWindow(QMainWindow):
                 self, "Error", f"Failed to open database inspector: {e}"
             )
 
-    def on_splitter_moved(self, pos, index):
-        self.left_panel_width = pos
+    def on_splitter_moved(self):
+        self.left_panel_width = self.main_splitter.sizes()[0]
         self.user_adjusted_splitter = True
 
     def resizeEvent(self, event):
@@ -1568,12 +1605,10 @@ class MainWindow(QMainWindow):
         settings = QSettings("YourOrg", "PDFLibraryManager")
 
         settings.setValue("window/geometry", self.saveGeometry())
-        settings.setValue("window/size", self.size())
-        settings.setValue("window/pos", self.pos())
 
         settings.setValue("window/state", self.saveState())
 
-        settings.setValue("splitter/sizes", self.main_splitter.sizes())
+        settings.setValue("splitter/main_state", self.main_splitter.saveState())
 
         settings.setValue("ui/main_tab_index", self.main_tabs.currentIndex())
         settings.setValue("ui/library_tab_index", self.library_tabs.currentIndex())
@@ -1593,40 +1628,19 @@ class MainWindow(QMainWindow):
     def restore_window_state(self):
         settings = QSettings("YourOrg", "PDFLibraryManager")
 
+        # 位置・サイズ・最大化状態は saveGeometry のバイト列から一度に復元する
+        # (画面構成が変わって復元できない場合は既定サイズにする)
         geometry = settings.value("window/geometry")
-        if geometry:
-            self.restoreGeometry(geometry)
-
-        size = settings.value("window/size")
-        pos = settings.value("window/pos")
-
-        if size and pos:
-            try:
-                if isinstance(size, str):
-                    width, height = map(int, size.strip("()").split(","))
-                    self.resize(width, height)
-                else:
-                    self.resize(size)
-
-                if isinstance(pos, str):
-                    x, y = map(int, pos.strip("()").split(","))
-                    self.move(x, y)
-                else:
-                    self.move(pos)
-            except (ValueError, TypeError):
-                print("Failed to restore window size/position, using defaults")
+        self._has_saved_geometry = bool(geometry) and self.restoreGeometry(geometry)
 
         state = settings.value("window/state")
         if state:
             self.restoreState(state)
 
-        splitter_sizes = settings.value("splitter/sizes")
-        if splitter_sizes:
-            try:
-                int_sizes = [int(size) for size in splitter_sizes]
-                self.main_splitter.setSizes(int_sizes)
-            except (TypeError, ValueError):
-                print("Failed to convert splitter sizes to integers")
+        splitter_state = settings.value("splitter/main_state")
+        if splitter_state and self.main_splitter.restoreState(splitter_state):
+            self.left_panel_width = self.main_splitter.sizes()[0]
+            self.user_adjusted_splitter = True
 
         self.pending_ui_restore = {
             "main_tab_index": settings.value("ui/main_tab_index", 0, int),
@@ -1670,9 +1684,12 @@ class MainWindow(QMainWindow):
 
     def restore_series_selection(self, series_id):
         if self.main_tabs.currentIndex() == 1:
+            # フィルタの復元で予約された再構築に選択を消されないよう、先に済ませておく
             if self.series_tabs.currentIndex() == 0:
+                self.series_grid_view.flush_refresh()
                 self.series_grid_view.select_series(series_id, emit_signal=False)
             else:
+                self.series_list_view.flush_refresh()
                 self.series_list_view.select_series(series_id, emit_signal=False)
 
     def restore_book_selection(self, book_id):
@@ -1,5 +1,4 @@
-from PyQt6.QtCore import QByteArray, Qt
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -21,6 +20,8 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from utils.ui_utils import create_pixmap_from_bytes
+
 
 class BatchMetadataEditor(QDialog):
     def __init__(self, library_controller, book_ids, parent=None):
@@ -28,9 +29,7 @@ class BatchMetadataEditor(QDialog):
 
         self.library_controller = library_controller
         self.book_ids = book_ids
-        self.books = [library_controller.get_book(book_id) for book_id in book_ids]
-
-        self.books = [book for book in self.books if book is not None]
+        self.books = library_controller.get_books(book_ids)
         if not self.books:
             raise ValueError("No valid books found for the provided IDs.")
 
@@ -101,13 +100,10 @@ class BatchMetadataEditor(QDialog):
             publisher_item = QTableWidgetItem(book.publisher or "")
             self.books_table.setItem(i, 2, publisher_item)
 
-            series_text = ""
-            if book.series_id:
-                series = self.library_controller.get_series(book.series_id)
-                if series:
-                    series_text = series.name
-                    if book.series_order:
-                        series_text += f" #{book.series_order}"
+            # シリーズ名は書籍取得時に JOIN 済みなので、行ごとにシリーズを問い合わせない
+            series_text = book.series_name or ""
+            if series_text and book.series_order:
+                series_text += f" #{book.series_order}"
             series_item = QTableWidgetItem(series_text)
             self.books_table.setItem(i, 3, series_item)
 
@@ -367,13 +363,11 @@ class BatchMetadataEditor(QDialog):
                     else:
                         sorted_books = sorted(self.books, key=lambda b: b.title)
 
-                    current_order = start_order
-                    for book in sorted_books:
-                        if book.id in self.book_ids:
-                            self.library_controller.update_book_metadata(
-                                book.id, series_id=series_id, series_order=current_order
-                            )
-                            current_order += 1
+                    self.library_controller.batch_add_to_series(
+                        [book.id for book in sorted_books if book.id in self.book_ids],
+                        series_id,
+                        start_order,
+                    )
 
         for key, edit in self.custom_editors.items():
             value = edit.text().strip()
@@ -386,8 +380,7 @@ class BatchMetadataEditor(QDialog):
             )
 
         if status is not None:
-            for book_id in self.book_ids:
-                self.library_controller.update_book_progress(book_id, status=status)
+            self.library_controller.batch_update_status(self.book_ids, status)
 
 
 class MetadataEditor(QDialog):
@@ -442,14 +435,12 @@ class MetadataEditor(QDialog):
 
         self.cover_label = QLabel()
         self.cover_label.setFixedSize(150, 200)
-        self.cover_label.setScaledContents(True)
+        self.cover_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.cover_label.setFrameShape(QLabel.Shape.Box)
 
         cover_data = self.book.get_cover_image()
         if cover_data:
-            pixmap = QPixmap()
-            pixmap.loadFromData(QByteArray(cover_data))
-            self.cover_label.setPixmap(pixmap)
+            self.cover_label.setPixmap(create_pixmap_from_bytes(cover_data, (150, 200)))
 
         cover_layout.addWidget(self.cover_label, alignment=Qt.AlignmentFlag.AlignCenter)
 
@@ -491,12 +482,7 @@ class MetadataEditor(QDialog):
 
         self.status_combo = QComboBox()
         self.status_combo.addItems(["Unread", "Reading", "Completed"])
-        current_status = "Unread"
-        if self.book.status == self.book.STATUS_READING:
-            current_status = "Reading"
-        elif self.book.status == self.book.STATUS_COMPLETED:
-            current_status = "Completed"
-        self.status_combo.setCurrentText(current_status)
+        self.status_combo.setCurrentText(self.book.status_name)
         info_layout.addRow("Reading Status:", self.status_combo)
 
         progress_text = f"{self.book.current_page + 1} / {self.book.total_pages}"
@@ -598,9 +584,7 @@ class MetadataEditor(QDialog):
     def regenerate_cover(self):
         cover_data = self.book.get_cover_image(force_reload=True)
         if cover_data:
-            pixmap = QPixmap()
-            pixmap.loadFromData(QByteArray(cover_data))
-            self.cover_label.setPixmap(pixmap)
+            self.cover_label.setPixmap(create_pixmap_from_bytes(cover_data, (150, 200)))
 
     def create_new_series(self):
         name = self.new_series_edit.text().strip()
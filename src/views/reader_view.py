@@ -241,14 +241,8 @@ class PDFReaderView(QWidget):
         self.progress_slider.setValue(progress_pct)
         self.progress_slider.blockSignals(False)
 
-        status_text = "Unread"
-        if book.status == book.STATUS_READING:
-            status_text = "Reading"
-        elif book.status == book.STATUS_COMPLETED:
-            status_text = "Completed"
-
         self.status_label.setText(
-            f"{status_text} - Page {self.current_page_num + 1} of {book.total_pages} ({progress_pct}%)"
+            f"{book.status_name} - Page {self.current_page_num + 1} of {book.total_pages} ({progress_pct}%)"
         )
 
     def show_current_page(self):
@@ -145,13 +145,7 @@ class SeriesEditor(QDialog):
                 order_spin.setValue(book.series_order)
             self.books_table.setCellWidget(i, 2, order_spin)
 
-            status_text = "Unread"
-            if book.status == book.STATUS_READING:
-                status_text = "Reading"
-            elif book.status == book.STATUS_COMPLETED:
-                status_text = "Completed"
-
-            status_item = QTableWidgetItem(status_text)
+            status_item = QTableWidgetItem(book.status_name)
             status_item.setFlags(status_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
             self.books_table.setItem(i, 3, status_item)
 
@@ -1,11 +1,11 @@
+import logging
 import re
 
-from PyQt6.QtCore import QByteArray, QEvent, QPoint, Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QAction, QPixmap
+from PyQt6.QtCore import QEvent, Qt, QThread, QTimer, pyqtSignal
+from PyQt6.QtGui import QAction, QPixmapCache
 from PyQt6.QtWidgets import (
     QAbstractItemView,
     QFrame,
-    QGridLayout,
     QHBoxLayout,
     QLabel,
     QListWidget,
@@ -17,128 +17,185 @@ from PyQt6.QtWidgets import (
 )
 
 from models.book import Book
+from utils.ui_utils import create_pixmap_from_bytes, get_placeholder_pixmap
+
+logger = logging.getLogger(__name__)
+
+
+def _plain_label(text=""):
+    # シリーズ名や書名に < や & が含まれても、リッチテキストとして解釈させない
+    label = QLabel(text)
+    label.setTextFormat(Qt.TextFormat.PlainText)
+    label.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+    return label
+
+
+def _series_cover_pixmap(series, size, thumbnail_size=None):
+    def natural_sort_key(book):
+        title = book.title if book.title else ""
+        return [
+            int(c) if c.isdigit() else c.lower() for c in re.split(r"(\d+)", title)
+        ]
+
+    first_book = min(
+        series.books,
+        key=lambda b: (b.series_order or float("inf"), natural_sort_key(b)),
+        default=None,
+    )
+    if first_book is None:
+        return None
+
+    # ウィジェットが再利用されても同じ表紙を再デコードしないよう、縮小済みの画像をキャッシュする
+    key = f"series_cover:{first_book.id}:{first_book.file_path}:{size[0]}x{size[1]}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        cover_data = first_book.get_cover_image(thumbnail_size=thumbnail_size)
+        if not cover_data:
+            return None
+
+        pixmap = create_pixmap_from_bytes(cover_data, size)
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+class SeriesFetchWorker(QThread):
+    fetched = pyqtSignal(list, dict)
+
+    def __init__(self, db_path, category_id=None, parent=None):
+        super().__init__(parent)
+        self.db_path = db_path
+        self.category_id = category_id
+
+    def run(self):
+        from controllers.library_controller import LibraryController
+        from models.database import DatabaseManager
+
+        # sqlite3の接続はスレッドをまたげないので、行データだけを返して
+        # Series の組み立ては受け取った側 (UIスレッド) の接続で行う
+        db_manager = DatabaseManager(self.db_path, create_tables=False)
+        try:
+            library_controller = LibraryController(db_manager)
+            series_data_list, books_by_series = library_controller.get_all_series_data(
+                category_id=self.category_id
+            )
+            self.fetched.emit(series_data_list, books_by_series)
+        except Exception as e:
+            logger.error("Error fetching series: %s", e)
+        finally:
+            db_manager.close()
 
 
 class SeriesGridItemWidget(QWidget):
+    clicked = pyqtSignal(object, int)
+
+    TEXT_WIDTH = 150
+
     def __init__(self, series, parent=None):
         super().__init__(parent)
 
-        self.series = series
-        self.cover_loaded = False
+        # 選択時の背景はビュー側のスタイルシートで selected プロパティを見て描画する
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground)
+        self.setProperty("selected", False)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(5, 5, 5, 5)
 
         self.cover_label = QLabel()
         self.cover_label.setFixedSize(150, 200)
-        self.cover_label.setScaledContents(True)
         self.cover_label.setFrameShape(QFrame.Shape.Box)
-
-        self.cover_label.setText("Series")
         self.cover_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.cover_label.setStyleSheet("background-color: #f0f0f0;")
-
         layout.addWidget(self.cover_label, alignment=Qt.AlignmentFlag.AlignCenter)
 
-        self.title_label = QLabel(self._truncate_text(series.name, 25))
-        self.title_label.setStyleSheet("font-weight: bold;")
+        self.title_label = _plain_label()
+        title_font = self.title_label.font()
+        title_font.setBold(True)
+        self.title_label.setFont(title_font)
         self.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.title_label.setWordWrap(True)
-        self.title_label.setToolTip(series.name)
         layout.addWidget(self.title_label)
 
+        self.count_label = _plain_label()
+        self.count_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self.count_label)
+
+        # ウィジェットを再利用できるよう、カテゴリと進捗のラベルは常に作って表示だけ切り替える
+        self.category_badge = _plain_label()
+        self.category_badge.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.category_badge.setStyleSheet(
+            "background-color: #e0e0e0; border-radius: 3px; padding: 2px;"
+        )
+        layout.addWidget(self.category_badge)
+
+        self.progress_label = _plain_label()
+        self.progress_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self.progress_label)
+
+        self.set_series(series)
+
+    def set_series(self, series):
+        self.series = series
+        self.cover_loaded = False
+        self.cover_label.setPixmap(get_placeholder_pixmap("Series", 150, 200))
+
+        self.title_label.setText(self._elide_text(self.title_label, series.name))
+        self.title_label.setToolTip(series.name)
+
         book_count = len(series.books)
-        self.count_label = QLabel(
+        self.count_label.setText(
             f"{book_count} {'books' if book_count != 1 else 'book'}"
         )
-        self.count_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(self.count_label)
 
         if series.category_name:
-            self.category_badge = QLabel(self._truncate_text(series.category_name, 20))
-            self.category_badge.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.category_badge.setStyleSheet(
-                "background-color: #e0e0e0; border-radius: 3px; padding: 2px;"
+            self.category_badge.setText(
+                self._elide_text(self.category_badge, series.category_name)
             )
             self.category_badge.setToolTip(series.category_name)
-            layout.addWidget(self.category_badge)
+        self.category_badge.setVisible(bool(series.category_name))
 
         status_counts = series.get_reading_status()
         total_books = sum(status_counts.values())
         if total_books > 0:
             completed = status_counts.get(Book.STATUS_COMPLETED, 0)
             progress = int(completed / total_books * 100)
+            self.progress_label.setText(f"Completed: {progress}%")
+        self.progress_label.setVisible(total_books > 0)
 
-            self.progress_label = QLabel(f"Completed: {progress}%")
-            self.progress_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            layout.addWidget(self.progress_label)
-
-    def _truncate_text(self, text, max_length):
-        if len(text) > max_length:
-            return text[: max_length - 3] + "..."
-        return text
+    def _elide_text(self, label, text):
+        return label.fontMetrics().elidedText(
+            text, Qt.TextElideMode.ElideRight, self.TEXT_WIDTH
+        )
 
     def load_cover_image(self):
         if self.cover_loaded:
             return
 
         try:
-            cover_data = self.get_series_cover_image(self.series)
-            if cover_data:
-                pixmap = QPixmap()
-                pixmap.loadFromData(QByteArray(cover_data))
+            pixmap = _series_cover_pixmap(self.series, (150, 200), (150, 200))
+            if pixmap is not None:
                 self.cover_label.setPixmap(pixmap)
                 self.cover_loaded = True
             else:
-                self.cover_label.setText("Series")
-                self.cover_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+                self.cover_label.setPixmap(get_placeholder_pixmap("Series", 150, 200))
                 self.cover_loaded = True
         except Exception as e:
-            print(f"Error loading series cover: {e}")
-            self.cover_label.setText("Series")
-            self.cover_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            logger.debug("Error loading series cover: %s", e)
+            self.cover_label.setPixmap(get_placeholder_pixmap("Series", 150, 200))
             self.cover_loaded = True
 
-    def get_series_cover_image(self, series):
-        def natural_sort_key(book):
-            title = book.title if book.title else ""
-            return [
-                int(c) if c.isdigit() else c.lower() for c in re.split(r"(\d+)", title)
-            ]
-
-        books = sorted(
-            series.books,
-            key=lambda b: (b.series_order or float("inf"), natural_sort_key(b)),
-        )
-
-        if books:
-            first_book = books[0]
-            return first_book.get_cover_image(thumbnail_size=(150, 200))
-        return None
-
     def update_series_info(self, series):
-        self.series = series
+        self.set_series(series)
+        QTimer.singleShot(50, self.load_cover_image)
 
-        self.title_label.setText(self._truncate_text(series.name, 25))
-        self.title_label.setToolTip(series.name)
+    def set_selected(self, selected):
+        if self.property("selected") == selected:
+            return
 
-        book_count = len(series.books)
-        self.count_label.setText(
-            f"{book_count} {'books' if book_count != 1 else 'book'}"
-        )
+        self.setProperty("selected", selected)
+        self.style().unpolish(self)
+        self.style().polish(self)
 
-        if hasattr(self, "progress_label"):
-            status_counts = series.get_reading_status()
-            total_books = sum(status_counts.values())
-            if total_books > 0:
-                completed = status_counts.get(Book.STATUS_COMPLETED, 0)
-                progress = int(completed / total_books * 100)
-                self.progress_label.setText(f"Completed: {progress}%")
-
-        self.cover_loaded = False
-        self.cover_label.setText("Series")
-        self.cover_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        QTimer.singleShot(50, self.load_cover_image)
+    def mousePressEvent(self, event):
+        self.clicked.emit(event, self.series.id)
 
     def enterEvent(self, event):
         if not self.cover_loaded:
@@ -157,23 +214,20 @@ class SeriesListItemWidget(QWidget):
 
         self.cover_label = QLabel()
         self.cover_label.setFixedSize(48, 64)
-        self.cover_label.setScaledContents(True)
+        self.cover_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.cover_label.setFrameShape(QFrame.Shape.Box)
 
-        cover_data = self.get_series_cover_image(series)
-        if cover_data:
-            pixmap = QPixmap()
-            pixmap.loadFromData(QByteArray(cover_data))
+        pixmap = _series_cover_pixmap(series, (48, 64))
+        if pixmap is not None:
             self.cover_label.setPixmap(pixmap)
         else:
-            self.cover_label.setText("Series")
-            self.cover_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            self.cover_label.setPixmap(get_placeholder_pixmap("Series", 48, 64))
 
         layout.addWidget(self.cover_label)
 
         info_layout = QVBoxLayout()
 
-        self.title_label = QLabel(series.name)
+        self.title_label = _plain_label(series.name)
         self.title_label.setStyleSheet("font-weight: bold;")
         info_layout.addWidget(self.title_label)
 
@@ -183,36 +237,19 @@ class SeriesListItemWidget(QWidget):
         reading = status_counts.get(Book.STATUS_READING, 0)
         unread = status_counts.get(Book.STATUS_UNREAD, 0)
 
-        self.count_label = QLabel(
+        self.count_label = _plain_label(
             f"{book_count} {'books' if book_count != 1 else 'book'} "
             f"({completed} completed, {reading} reading, {unread} unread)"
         )
         info_layout.addWidget(self.count_label)
 
         if series.category_name:
-            self.category_label = QLabel(f"Category: {series.category_name}")
+            self.category_label = _plain_label(f"Category: {series.category_name}")
             info_layout.addWidget(self.category_label)
 
         layout.addLayout(info_layout)
         layout.setStretch(1, 1)
 
-    def get_series_cover_image(self, series):
-        def natural_sort_key(book):
-            title = book.title if book.title else ""
-            return [
-                int(c) if c.isdigit() else c.lower() for c in re.split(r"(\d+)", title)
-            ]
-
-        books = sorted(
-            series.books,
-            key=lambda b: (b.series_order or float("inf"), natural_sort_key(b)),
-        )
-
-        if books:
-            first_book = books[0]
-            return first_book.get_cover_image()
-        return None
-
     def update_series_info(self, series):
         self.series = series
 
@@ -233,6 +270,16 @@ class SeriesListItemWidget(QWidget):
 class SeriesGridView(QScrollArea):
     series_selected = pyqtSignal(int)
 
+    ITEM_WIDTH = 190
+    ITEM_HEIGHT = 300
+    ITEM_SPACING = 10
+    GRID_MARGIN = 5
+
+    STYLE_SHEET = (
+        'SeriesGridItemWidget[selected="true"] '
+        "{ background-color: #e0e0ff; border: 1px solid #9090ff; }"
+    )
+
     def __init__(self, library_controller, parent=None):
         super().__init__(parent)
 
@@ -240,43 +287,76 @@ class SeriesGridView(QScrollArea):
 
         self.setWidgetResizable(True)
 
+        # アイテムは固定サイズなので、レイアウトを使わず位置を直接計算して配置する
         self.content_widget = QWidget()
+        self.content_widget.setStyleSheet(self.STYLE_SHEET)
         self.setWidget(self.content_widget)
 
-        self.grid_layout = QGridLayout(self.content_widget)
-        self.grid_layout.setSpacing(10)
-        self.grid_layout.setContentsMargins(5, 5, 5, 5)
-
         self.selected_series_id = None
 
         self.category_filter = None
         self.search_query = None
 
+        # ウィジェットは表示範囲 (前後1行を含む) のシリーズにだけ割り当てる
         self.series_widgets = {}
 
+        # 表示範囲から外れたウィジェットは破棄せず、別のシリーズに再利用する
+        self._widget_pool = []
+
         self.all_series = []
-        self.loaded_count = 0
-        self.batch_size = 15
-        self.is_loading = False
-        self.loading_timer = None
+        self._index_by_id = {}
+        self._window = None
         self.visible_widgets = set()
 
+        self._cover_timer = QTimer(self)
+        self._cover_timer.setSingleShot(True)
+        self._cover_timer.setInterval(100)
+        self._cover_timer.timeout.connect(self.update_visible_widgets)
+
         self.grid_columns = 3
-        self.item_width = 190
         self.last_viewport_width = 0
 
+        # ドラッグ中のリサイズは最後の幅だけでグリッドを組み直す
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(self._apply_resize)
+
+        # 連続したレイアウト要求は1回の再計算にまとめる
+        self._layout_timer = QTimer(self)
+        self._layout_timer.setSingleShot(True)
+        self._layout_timer.setInterval(50)
+        self._layout_timer.timeout.connect(self._do_ensure_layout)
+
+        # 立て続けの refresh は最後の1回だけシリーズを読み込む
+        self._load_timer = QTimer(self)
+        self._load_timer.setSingleShot(True)
+        self._load_timer.setInterval(50)
+        self._load_timer.timeout.connect(self._load_series_async)
+
         self.verticalScrollBar().valueChanged.connect(self.check_scroll_position)
 
         self.installEventFilter(self)
 
-        self.placeholder = QLabel("Loading series...")
+        self.placeholder = QLabel("Loading series...", self.content_widget)
         self.placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.placeholder.setStyleSheet("color: gray; font-size: 16px;")
-        self.grid_layout.addWidget(self.placeholder, 0, 0)
+
+        self._build_context_menus()
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
 
+        self.placeholder.setGeometry(self.viewport().rect())
+
+        if self.viewport().width() == self.last_viewport_width:
+            # 高さだけが変わった場合は表示範囲のウィジェットだけを更新する
+            self._update_window()
+            return
+
+        self._resize_timer.start()
+
+    def _apply_resize(self):
         current_width = self.viewport().width()
 
         if current_width == self.last_viewport_width:
@@ -284,9 +364,7 @@ class SeriesGridView(QScrollArea):
 
         self.last_viewport_width = current_width
 
-        self.calculate_grid_columns()
-
-        if self.series_widgets:
+        if self.calculate_grid_columns() and self.all_series:
             self.relayout_grid()
 
     def eventFilter(self, obj, event):
@@ -297,106 +375,136 @@ class SeriesGridView(QScrollArea):
     def calculate_grid_columns(self):
         viewport_width = self.viewport().width()
 
-        available_width = max(1, viewport_width - 10)
+        available_width = max(1, viewport_width - self.GRID_MARGIN * 2)
 
-        new_columns = max(1, int(available_width / self.item_width))
+        new_columns = max(
+            1,
+            (available_width + self.ITEM_SPACING)
+            // (self.ITEM_WIDTH + self.ITEM_SPACING),
+        )
 
         if new_columns != self.grid_columns:
             self.grid_columns = new_columns
             return True
         return False
 
-    def relayout_grid(self):
-        widgets = []
-        for series_id, widget in self.series_widgets.items():
-            self.grid_layout.removeWidget(widget)
-            widgets.append((series_id, widget))
-
-        for i, (series_id, widget) in enumerate(widgets):
-            row = i // self.grid_columns
-            col = i % self.grid_columns
-            self.grid_layout.addWidget(widget, row, col)
+    def _place_widget(self, widget, index):
+        row, col = divmod(index, self.grid_columns)
+        widget.setGeometry(
+            self.GRID_MARGIN + col * (self.ITEM_WIDTH + self.ITEM_SPACING),
+            self.GRID_MARGIN + row * (self.ITEM_HEIGHT + self.ITEM_SPACING),
+            self.ITEM_WIDTH,
+            self.ITEM_HEIGHT,
+        )
 
-        width = min(self.grid_columns * self.item_width, self.viewport().width())
+    def _update_content_height(self):
+        rows = -(-len(self.all_series) // self.grid_columns)
+        height = self.GRID_MARGIN * 2
+        if rows:
+            height += rows * (self.ITEM_HEIGHT + self.ITEM_SPACING) - self.ITEM_SPACING
+        self.content_widget.setMinimumHeight(height)
 
-        self.content_widget.updateGeometry()
+    def relayout_grid(self):
+        self._update_content_height()
+        self._update_window(force=True)
 
-        QTimer.singleShot(50, self.update_visible_widgets)
+        self._cover_timer.start()
 
     def refresh(self):
         self._clear_grid()
 
-        self.loaded_count = 0
-
-        self.placeholder = QLabel("Loading series...")
-        self.placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.placeholder.setStyleSheet("color: gray; font-size: 16px;")
-        self.grid_layout.addWidget(self.placeholder, 0, 0)
-
-        QTimer.singleShot(50, self._load_series_async)
-
-    def _load_series_async(self):
-        self.all_series = self._get_filtered_series()
-
-        if self.placeholder.parent() == self.content_widget:
-            self.placeholder.setParent(None)
-            self.placeholder.deleteLater()
-
-        self.calculate_grid_columns()
+        self.placeholder.setGeometry(self.viewport().rect())
+        self.placeholder.show()
 
-        self.load_more_series()
+        self._load_timer.start()
 
-    def load_more_series(self):
-        if self.is_loading or self.loaded_count >= len(self.all_series):
+    def set_series(self, series_list):
+        # 取得済みの一覧をそのまま表示する (カテゴリで絞り込み中は取得し直す)
+        if self.category_filter is not None:
+            self.refresh()
             return
 
-        self.is_loading = True
+        self._load_timer.stop()
+        self._clear_grid()
+        self._show_series(self._filter_series(series_list))
 
-        start_idx = self.loaded_count
-        end_idx = min(start_idx + self.batch_size, len(self.all_series))
+    def flush_refresh(self):
+        # 保留中の読み込みがあれば今すぐ行う (直後に選択を復元するような呼び出し元向け)
+        if self._load_timer.isActive():
+            self._load_timer.stop()
+            self._load_series_async()
 
+    def _load_series_async(self):
+        self._show_series(self._get_filtered_series())
+
+    def _show_series(self, series_list):
         def natural_sort_key(series):
             name = series.name if series.name else ""
             return [
                 int(c) if c.isdigit() else c.lower() for c in re.split(r"(\d+)", name)
             ]
 
-        sorted_series = sorted(self.all_series, key=natural_sort_key)
+        self.all_series = sorted(series_list, key=natural_sort_key)
+        self._index_by_id = {
+            series.id: index for index, series in enumerate(self.all_series)
+        }
+
+        self.placeholder.hide()
 
-        for i in range(start_idx, end_idx):
-            if i >= len(sorted_series):
-                break
+        self.calculate_grid_columns()
 
-            series = sorted_series[i]
-            row = i // self.grid_columns
-            col = i % self.grid_columns
+        self.relayout_grid()
 
-            series_widget = SeriesGridItemWidget(series)
-            series_widget.setFixedSize(190, 300)
-            series_widget.setCursor(Qt.CursorShape.PointingHandCursor)
-            series_widget.mousePressEvent = (
-                lambda event, s=series.id: self._on_series_clicked(event, s)
-            )
+    def _visible_range(self):
+        row_height = self.ITEM_HEIGHT + self.ITEM_SPACING
+        top = max(0, self.verticalScrollBar().value() - self.GRID_MARGIN)
+        bottom = top + self.viewport().height()
 
-            self.grid_layout.addWidget(series_widget, row, col)
+        first_row = max(0, top // row_height - 1)
+        last_row = bottom // row_height + 1
 
-            self.series_widgets[series.id] = series_widget
+        start = min(len(self.all_series), first_row * self.grid_columns)
+        end = min(len(self.all_series), (last_row + 1) * self.grid_columns)
+        return start, end
 
-        self.loaded_count = end_idx
+    def _update_window(self, force=False):
+        window = self._visible_range()
+        if window == self._window and not force:
+            return
+        self._window = window
+
+        start, end = window
+        visible_ids = {series.id for series in self.all_series[start:end]}
+        for series_id in [sid for sid in self.series_widgets if sid not in visible_ids]:
+            self._release_widget(series_id)
+
+        for index in range(start, end):
+            series = self.all_series[index]
+            widget = self.series_widgets.get(series.id)
+            if widget is None:
+                widget = self._acquire_widget(series)
+            self._place_widget(widget, index)
+
+    def _acquire_widget(self, series):
+        if self._widget_pool:
+            widget = self._widget_pool.pop()
+            widget.set_series(series)
+        else:
+            widget = SeriesGridItemWidget(series, self.content_widget)
+            widget.setFixedSize(self.ITEM_WIDTH, self.ITEM_HEIGHT)
+            widget.setCursor(Qt.CursorShape.PointingHandCursor)
+            widget.clicked.connect(self._on_series_clicked)
 
-        self.is_loading = False
+        widget.set_selected(series.id == self.selected_series_id)
+        widget.show()
 
-        if self.loaded_count < len(self.all_series):
-            try:
-                main_window = self.window()
-                if main_window and hasattr(main_window, "statusBar"):
-                    main_window.statusBar.showMessage(
-                        f"Loaded {self.loaded_count} of {len(self.all_series)} series"
-                    )
-            except Exception as e:
-                print(f"Error updating status bar: {e}")
+        self.series_widgets[series.id] = widget
+        return widget
 
-        QTimer.singleShot(50, self.update_visible_widgets)
+    def _release_widget(self, series_id):
+        widget = self.series_widgets.pop(series_id)
+        widget.hide()
+        self._widget_pool.append(widget)
 
     def update_visible_widgets(self):
         if not self.series_widgets:
@@ -411,47 +519,42 @@ class SeriesGridView(QScrollArea):
         new_visible_widgets = set()
 
         for series_id, widget in self.series_widgets.items():
-            widget_pos = widget.mapTo(self.content_widget, QPoint(0, 0))
-            widget_top = widget_pos.y()
+            widget_top = widget.y()
             widget_bottom = widget_top + widget.height()
 
             if widget_bottom >= visible_top and widget_top <= visible_bottom:
                 new_visible_widgets.add(series_id)
 
-                if isinstance(widget, SeriesGridItemWidget) and not widget.cover_loaded:
+                if not widget.cover_loaded:
                     QTimer.singleShot(10, widget.load_cover_image)
 
         self.visible_widgets = new_visible_widgets
 
     def check_scroll_position(self, value):
-        scrollbar = self.verticalScrollBar()
-        if value > scrollbar.maximum() * 0.7:
-            self.load_more_series()
-
-        if self.loading_timer:
-            self.loading_timer.stop()
+        self._update_window()
 
-        self.loading_timer = QTimer()
-        self.loading_timer.setSingleShot(True)
-        self.loading_timer.timeout.connect(self.update_visible_widgets)
-        self.loading_timer.start(100)
+        self._cover_timer.start()
 
     def _clear_grid(self):
-        while self.grid_layout.count():
-            item = self.grid_layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
+        for series_id in list(self.series_widgets):
+            self._release_widget(series_id)
 
-        self.series_widgets = {}
+        self.all_series = []
+        self._index_by_id = {}
+        self._window = None
         self.selected_series_id = None
         self.visible_widgets = set()
 
+        self._update_content_height()
+
     def _get_filtered_series(self):
         series_list = self.library_controller.get_all_series(
             category_id=self.category_filter
         )
 
+        return self._filter_series(series_list)
+
+    def _filter_series(self, series_list):
         if self.search_query:
             query = self.search_query.lower()
             filtered_list = []
@@ -478,39 +581,48 @@ class SeriesGridView(QScrollArea):
             return
 
         if self.selected_series_id in self.series_widgets:
-            self.series_widgets[self.selected_series_id].setStyleSheet("")
+            self.series_widgets[self.selected_series_id].set_selected(False)
 
         self.selected_series_id = series_id
-        self.series_widgets[series_id].setStyleSheet(
-            "background-color: #e0e0ff; border: 1px solid #9090ff;"
-        )
+        self.series_widgets[series_id].set_selected(True)
 
         self.series_selected.emit(series_id)
 
         widget = self.series_widgets[series_id]
-        if isinstance(widget, SeriesGridItemWidget) and not widget.cover_loaded:
+        if not widget.cover_loaded:
             QTimer.singleShot(10, widget.load_cover_image)
 
-    def _show_context_menu(self, position, series_id):
-        menu = QMenu()
+    def _build_context_menus(self):
+        # メニューは一度だけ構築し、表示時に対象のシリーズIDだけを差し替える
+        self._context_series_id = None
+
+        self._context_menu = QMenu(self)
 
         view_action = QAction("View Series", self)
-        view_action.triggered.connect(lambda: self.series_selected.emit(series_id))
-        menu.addAction(view_action)
+        view_action.triggered.connect(
+            lambda: self.series_selected.emit(self._context_series_id)
+        )
+        self._context_menu.addAction(view_action)
 
-        menu.addSeparator()
+        self._context_menu.addSeparator()
 
         edit_action = QAction("Edit Series", self)
-        edit_action.triggered.connect(lambda: self._edit_series(series_id))
-        menu.addAction(edit_action)
+        edit_action.triggered.connect(
+            lambda: self._edit_series(self._context_series_id)
+        )
+        self._context_menu.addAction(edit_action)
 
-        menu.addSeparator()
+        self._context_menu.addSeparator()
 
         remove_action = QAction("Remove Series", self)
-        remove_action.triggered.connect(lambda: self._remove_series(series_id))
-        menu.addAction(remove_action)
+        remove_action.triggered.connect(
+            lambda: self._remove_series(self._context_series_id)
+        )
+        self._context_menu.addAction(remove_action)
 
-        menu.exec(position)
+    def _show_context_menu(self, position, series_id):
+        self._context_series_id = series_id
+        self._context_menu.exec(position)
 
     def _edit_series(self, series_id):
         pass
@@ -522,50 +634,66 @@ class SeriesGridView(QScrollArea):
         self.category_filter = category_id
         self.search_query = None
         self.refresh()
-        QTimer.singleShot(50, self.ensure_correct_layout)
+        self.ensure_correct_layout()
 
     def search(self, query):
         self.search_query = query
         self.refresh()
-        QTimer.singleShot(50, self.ensure_correct_layout)
+        self.ensure_correct_layout()
 
     def clear_search(self):
         self.search_query = None
         self.refresh()
-        QTimer.singleShot(50, self.ensure_correct_layout)
+        self.ensure_correct_layout()
 
     def update_series_item(self, series_id):
-        if series_id in self.series_widgets:
-            series = self.library_controller.get_series(series_id)
-            if series:
-                widget = self.series_widgets[series_id]
-                if isinstance(widget, SeriesGridItemWidget):
-                    widget.update_series_info(series)
+        index = self._index_by_id.get(series_id)
+        if index is None:
+            return
+
+        series = self.library_controller.get_series(series_id)
+        if series:
+            self.all_series[index] = series
+            if series_id in self.series_widgets:
+                self.series_widgets[series_id].update_series_info(series)
 
     def select_series(self, series_id, emit_signal=True):
-        if series_id not in self.series_widgets:
+        index = self._index_by_id.get(series_id)
+        if index is None:
             return
 
+        # 未表示のシリーズは、スクロールしてウィジェットを割り当ててから選択する
+        row = index // self.grid_columns
+        row_top = self.GRID_MARGIN + row * (self.ITEM_HEIGHT + self.ITEM_SPACING)
+        self.ensureVisible(0, row_top + self.ITEM_HEIGHT // 2, 0, self.ITEM_HEIGHT)
+        self._update_window()
+
         if self.selected_series_id in self.series_widgets:
-            self.series_widgets[self.selected_series_id].setStyleSheet("")
+            self.series_widgets[self.selected_series_id].set_selected(False)
 
         self.selected_series_id = series_id
-        self.series_widgets[series_id].setStyleSheet(
-            "background-color: #e0e0ff; border: 1px solid #9090ff;"
-        )
 
         if emit_signal:
             self.series_selected.emit(series_id)
 
-        widget = self.series_widgets[series_id]
-        if isinstance(widget, SeriesGridItemWidget) and not widget.cover_loaded:
+        # 非表示やレイアウト前で表示範囲に入らなかった場合は、
+        # ウィジェットを割り当てるときに _acquire_widget が選択状態を反映する
+        widget = self.series_widgets.get(series_id)
+        if widget is None:
+            return
+
+        widget.set_selected(True)
+        if not widget.cover_loaded:
             QTimer.singleShot(10, widget.load_cover_image)
 
     def get_selected_series_id(self):
         return self.selected_series_id
 
     def ensure_correct_layout(self):
-        if self.calculate_grid_columns() and self.series_widgets:
+        self._layout_timer.start()
+
+    def _do_ensure_layout(self):
+        if self.calculate_grid_columns() and self.all_series:
             self.relayout_grid()
 
 
@@ -591,13 +719,45 @@ class SeriesListView(QWidget):
         )
         layout.addWidget(self.list_widget)
 
+        self._build_context_menus()
+
+        self._item_by_id = {}
+
         self.category_filter = None
         self.search_query = None
 
-        self.refresh()
+        # 立て続けの refresh は最後の1回だけ一覧を作り直す
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self.refresh_now)
 
     def refresh(self):
+        self._refresh_timer.start()
+
+    def set_series(self, series_list):
+        # 取得済みの一覧をそのまま表示する (カテゴリで絞り込み中は取得し直す)
+        if self.category_filter is not None:
+            self.refresh()
+            return
+
+        self._refresh_timer.stop()
+
         self.list_widget.clear()
+        self._item_by_id.clear()
+
+        self._populate_list(self._filter_series(series_list))
+
+    def flush_refresh(self):
+        # 保留中の再構築があれば今すぐ行う (直後に選択を復元するような呼び出し元向け)
+        if self._refresh_timer.isActive():
+            self.refresh_now()
+
+    def refresh_now(self):
+        self._refresh_timer.stop()
+
+        self.list_widget.clear()
+        self._item_by_id.clear()
 
         series_list = self._get_filtered_series()
 
@@ -608,6 +768,9 @@ class SeriesListView(QWidget):
             category_id=self.category_filter
         )
 
+        return self._filter_series(series_list)
+
+    def _filter_series(self, series_list):
         if self.search_query:
             query = self.search_query.lower()
             filtered_list = []
@@ -636,16 +799,29 @@ class SeriesListView(QWidget):
 
         sorted_series = sorted(series_list, key=natural_sort_key)
 
-        for series in sorted_series:
-            item = QListWidgetItem()
-            item.setData(Qt.ItemDataRole.UserRole, series.id)
-
-            widget = SeriesListItemWidget(series)
-
-            item.setSizeHint(widget.sizeHint())
-
-            self.list_widget.addItem(item)
-            self.list_widget.setItemWidget(item, widget)
+        # 追加のたびに再描画・レイアウトが走らないよう、挿入が終わるまで更新を止める
+        self.list_widget.setUpdatesEnabled(False)
+        self.list_widget.blockSignals(True)
+        try:
+            # 行の高さはカテゴリ行の有無でしか変わらないため、sizeHint は形ごとに1回だけ計算する
+            size_hints = {}
+            for series in sorted_series:
+                item = QListWidgetItem()
+                item.setData(Qt.ItemDataRole.UserRole, series.id)
+
+                widget = SeriesListItemWidget(series)
+
+                shape = bool(series.category_name)
+                if shape not in size_hints:
+                    size_hints[shape] = widget.sizeHint()
+                item.setSizeHint(size_hints[shape])
+
+                self.list_widget.addItem(item)
+                self.list_widget.setItemWidget(item, widget)
+                self._item_by_id[series.id] = item
+        finally:
+            self.list_widget.blockSignals(False)
+            self.list_widget.setUpdatesEnabled(True)
 
     def _on_item_clicked(self, item):
         series_id = item.data(Qt.ItemDataRole.UserRole)
@@ -658,26 +834,37 @@ class SeriesListView(QWidget):
             global_pos = self.list_widget.mapToGlobal(position)
             self._show_context_menu(global_pos, series_id)
 
-    def _show_context_menu(self, position, series_id):
-        menu = QMenu()
+    def _build_context_menus(self):
+        # メニューは一度だけ構築し、表示時に対象のシリーズIDだけを差し替える
+        self._context_series_id = None
+
+        self._context_menu = QMenu(self)
 
         view_action = QAction("View Series", self)
-        view_action.triggered.connect(lambda: self.series_selected.emit(series_id))
-        menu.addAction(view_action)
+        view_action.triggered.connect(
+            lambda: self.series_selected.emit(self._context_series_id)
+        )
+        self._context_menu.addAction(view_action)
 
-        menu.addSeparator()
+        self._context_menu.addSeparator()
 
         edit_action = QAction("Edit Series", self)
-        edit_action.triggered.connect(lambda: self._edit_series(series_id))
-        menu.addAction(edit_action)
+        edit_action.triggered.connect(
+            lambda: self._edit_series(self._context_series_id)
+        )
+        self._context_menu.addAction(edit_action)
 
-        menu.addSeparator()
+        self._context_menu.addSeparator()
 
         remove_action = QAction("Remove Series", self)
-        remove_action.triggered.connect(lambda: self._remove_series(series_id))
-        menu.addAction(remove_action)
+        remove_action.triggered.connect(
+            lambda: self._remove_series(self._context_series_id)
+        )
+        self._context_menu.addAction(remove_action)
 
-        menu.exec(position)
+    def _show_context_menu(self, position, series_id):
+        self._context_series_id = series_id
+        self._context_menu.exec(position)
 
     def _edit_series(self, series_id):
         pass
@@ -699,25 +886,25 @@ class SeriesListView(QWidget):
         self.refresh()
 
     def update_series_item(self, series_id):
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            if item.data(Qt.ItemDataRole.UserRole) == series_id:
-                series = self.library_controller.get_series(series_id)
-                if series:
-                    widget = self.list_widget.itemWidget(item)
-                    if isinstance(widget, SeriesListItemWidget):
-                        widget.update_series_info(series)
-                break
+        item = self._item_by_id.get(series_id)
+        if not item:
+            return
+
+        series = self.library_controller.get_series(series_id)
+        if series:
+            widget = self.list_widget.itemWidget(item)
+            if isinstance(widget, SeriesListItemWidget):
+                widget.update_series_info(series)
 
     def select_series(self, series_id, emit_signal=True):
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            if item.data(Qt.ItemDataRole.UserRole) == series_id:
-                self.list_widget.setCurrentItem(item)
-
-                if emit_signal:
-                    self.series_selected.emit(series_id)
-                break
+        item = self._item_by_id.get(series_id)
+        if not item:
+            return
+
+        self.list_widget.setCurrentItem(item)
+
+        if emit_signal:
+            self.series_selected.emit(series_id)
 
     def get_selected_series_id(self):
         current_item = self.list_widget.currentItem()